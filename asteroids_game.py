@@ -90,8 +90,11 @@ class Ship(GameObject):
     def _shoot(self):
         """Create a bullet"""
         if hasattr(self, 'engine') and self.engine.current_scene:
-            bullet = Bullet()
-            bullet.transform.position = self.transform.position.copy()
+            bullet = self.engine.current_scene.spawn(Bullet)
+            position = self.transform.position
+            bullet_position = bullet.transform.position
+            bullet_position.x = position.x
+            bullet_position.y = position.y
             bullet.transform.rotation = self.transform.rotation
             
             # Bullet velocity based on ship direction and velocity
@@ -99,7 +102,6 @@ class Ship(GameObject):
             bullet.velocity = direction * 400 + self.velocity * 0.5
             
             bullet.engine = self.engine
-            self.engine.current_scene.add_object(bullet)
             
             # Play bullet sound effect
             if hasattr(self.engine, 'sound_generator'):
@@ -132,8 +134,14 @@ class Bullet(GameObject):
         self.velocity = Vector2.zero()
         self.lifetime = 2.0  # Bullets disappear after 2 seconds
         
-        sprite = Sprite(color='#FFFFFF', size=Vector2(3, 3))
-        self.add_component(sprite)
+        self.sprite = Sprite(color='#FFFFFF', size=Vector2(3, 3))
+        self.add_component(self.sprite)
+    
+    def reinitialize(self):
+        """Reuse a recycled bullet, keeping its sprite"""
+        self.velocity = Vector2.zero()
+        self.lifetime = 2.0
+        self.add_component(self.sprite)
         
     def update(self, delta_time: float):
         super().update(delta_time)
@@ -170,8 +178,8 @@ class Bullet(GameObject):
         if not self.engine.current_scene:
             return
             
-        asteroids = [obj for obj in self.engine.current_scene.game_objects 
-                    if isinstance(obj, Asteroid) and not obj.is_destroyed]
+        asteroids = [obj for obj in self.engine.current_scene.find_objects_of_type(Asteroid)
+                     if not obj.is_destroyed]
         
         for asteroid in asteroids:
             distance = self.transform.position.distance_to(asteroid.transform.position)
@@ -385,8 +393,8 @@ class AsteroidsGame(GameEngine):
                 self.score = self.current_scene.score
             
             # Check if all asteroids are destroyed
-            asteroids = [obj for obj in self.current_scene.game_objects 
-                        if isinstance(obj, Asteroid) and not obj.is_destroyed]
+            asteroids = [obj for obj in self.current_scene.find_objects_of_type(Asteroid)
+                         if not obj.is_destroyed]
             
             if len(asteroids) == 0:
                 self._next_wave()
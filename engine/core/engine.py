@@ -95,8 +95,9 @@ class GameEngine:
             self.delta_time = self.smoothed_delta_time
             self.total_time += self.delta_time
             
-            # Update input
-            self.input_manager.update()
+            # Update input (the window pumped events right after last frame's sleep)
+            self.input_manager.drain_events()
+            self.input_manager.snapshot_frame_state()
             
             # Update current scene
             if self.current_scene:
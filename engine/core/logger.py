@@ -3,7 +3,10 @@
 Logging system for the game engine
 Provides debug, info, warning, and error logging with configurable output
 """
+import atexit
+import queue
 import sys
+import threading
 import time
 from enum import Enum
 from typing import Optional, TextIO
@@ -17,6 +20,36 @@ class LogLevel(Enum):
     ERROR = 3
 
 
+class QueuedWriter:
+    """Writes log lines to their streams on a background thread, so logging only enqueues"""
+    
+    def __init__(self):
+        """Initialize and start the writer thread"""
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="LogWriter", daemon=True)
+        self._thread.start()
+    
+    def write(self, stream: TextIO, text: str):
+        """Queue text to be written to a stream"""
+        self._queue.put((stream, text))
+    
+    def stop(self):
+        """Write everything queued so far, then stop the thread"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+    
+    def _run(self):
+        """Write queued lines until stopped"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            stream, text = item
+            stream.write(text)
+            stream.flush()
+
+
 class Logger:
     """Game engine logger with multiple levels and formatting"""
     
@@ -29,6 +62,7 @@ class Logger:
         self.show_timestamps = True
         self.show_level = True
         self.show_logger_name = True
+        self.writer: Optional[QueuedWriter] = None  # Background writer, or None to write inline
         
         # Color codes for terminal output
         self.colors = {
@@ -87,6 +121,10 @@ class Logger:
         """Check if message should be logged based on level"""
         return level.value >= self.min_level.value
     
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Check if messages at a level would be written (to skip building them otherwise)"""
+        return self._should_log(level)
+    
     def _write_message(self, level: LogLevel, message: str):
         """Write message to appropriate stream"""
         if not self._should_log(level):
@@ -100,8 +138,11 @@ class Logger:
         else:
             stream = self.output_stream
         
-        stream.write(formatted + '\n')
-        stream.flush()
+        if self.writer is not None:
+            self.writer.write(stream, formatted + '\n')
+        else:
+            stream.write(formatted + '\n')
+            stream.flush()
     
     def debug(self, message: str):
         """Log debug message"""
@@ -131,6 +172,7 @@ class LoggerManager:
         """Initialize logger manager"""
         self.loggers = {}
         self.default_level = LogLevel.INFO
+        self.writer: Optional[QueuedWriter] = None
         
         # Create default engine logger
         self.engine_logger = Logger("Engine", self.default_level)
@@ -139,7 +181,9 @@ class LoggerManager:
     def get_logger(self, name: str) -> Logger:
         """Get or create a logger with the given name"""
         if name not in self.loggers:
-            self.loggers[name] = Logger(name, self.default_level)
+            logger = Logger(name, self.default_level)
+            logger.writer = self.writer
+            self.loggers[name] = logger
         return self.loggers[name]
     
     def set_global_level(self, level: LogLevel):
@@ -157,6 +201,19 @@ class LoggerManager:
         """Enable or disable timestamps for all loggers"""
         for logger in self.loggers.values():
             logger.show_timestamps = enabled
+    
+    def enable_queued_output(self, enabled: bool = True):
+        """Route all loggers' output through a background writer thread, or back to inline writes"""
+        if enabled and self.writer is None:
+            self.writer = QueuedWriter()
+            atexit.register(self.writer.stop)
+        elif not enabled and self.writer is not None:
+            atexit.unregister(self.writer.stop)
+            self.writer.stop()
+            self.writer = None
+        
+        for logger in self.loggers.values():
+            logger.writer = self.writer
 
 
 # Global logger manager instance
@@ -177,3 +234,7 @@ def enable_colors(enabled: bool = True):
 def configure_timestamps(enabled: bool = True):
     """Enable or disable timestamps globally"""
     _logger_manager.configure_timestamps(enabled)
+
+def enable_queued_output(enabled: bool = True):
+    """Enable or disable writing log output on a background thread globally"""
+    _logger_manager.enable_queued_output(enabled)
@@ -128,12 +128,12 @@ class Window:
             self.frame_count = 0
             self.fps_timer = 0.0
 
-        # Process tkinter events
+        # Present the frame
         try:
             self.root.update_idletasks()
-            self.root.update()
         except tk.TclError:
             self._should_close = True
+            return
 
         # Frame rate limiting with vsync control
         if self.vsync_enabled:
@@ -147,6 +147,12 @@ class Window:
             # Without vsync, just process as fast as possible
             pass
 
+        # Process tkinter events after the sleep so input is fresh for the next frame
+        try:
+            self.root.update()
+        except tk.TclError:
+            self._should_close = True
+
     def clear(self, color: str = '#141928'):
         """Clear the canvas with specified color"""
         self.canvas.delete("all")
@@ -2,10 +2,14 @@
 """
 Common ECS components
 """
+from typing import Dict, TYPE_CHECKING
 from ..math.vector2 import Vector2
 from ..math.transform import Transform as EngineTransform
 from .component import Component
 
+if TYPE_CHECKING:
+    from .entity import Entity
+
 
 class TransformComponent(Component):
     """Transform component for position, rotation, and scale"""
@@ -42,8 +46,9 @@ class VelocityComponent(Component):
     
     def limit_speed(self):
         """Limit velocity to max_speed if set"""
-        if self.max_speed and self.velocity.magnitude > self.max_speed:
-            self.velocity = self.velocity.normalize() * self.max_speed
+        max_speed = self.max_speed
+        if max_speed and self.velocity.magnitude_squared > max_speed * max_speed:
+            self.velocity = self.velocity.normalize() * max_speed
 
 
 class SpriteComponent(Component):
@@ -84,14 +89,22 @@ class TagComponent(Component):
     def __init__(self, *tags: str):
         super().__init__()
         self.tags = set(tags)
+        # The owning EntityManager's tag index, set while the component is attached
+        self.tag_index = None
     
     def add_tag(self, tag: str):
         """Add a tag"""
-        self.tags.add(tag)
+        if tag not in self.tags:
+            self.tags.add(tag)
+            if self.tag_index is not None:
+                _index_tag(self.tag_index, tag, self.entity)
     
     def remove_tag(self, tag: str):
         """Remove a tag"""
-        self.tags.discard(tag)
+        if tag in self.tags:
+            self.tags.discard(tag)
+            if self.tag_index is not None:
+                _unindex_tag(self.tag_index, tag, self.entity)
     
     def has_tag(self, tag: str) -> bool:
         """Check if has tag"""
@@ -125,3 +138,17 @@ class TimerComponent(Component):
         """Reset timer"""
         self.current_time = 0.0
         self.is_finished = False
+
+
+def _index_tag(entities_by_tag: Dict[str, Dict[str, 'Entity']], tag: str, entity: 'Entity'):
+    """Add an entity to the index for a tag (entities_by_tag is a defaultdict(dict))"""
+    entities_by_tag[tag][entity.id] = entity
+
+
+def _unindex_tag(entities_by_tag: Dict[str, Dict[str, 'Entity']], tag: str, entity: 'Entity'):
+    """Remove an entity from the index for a tag"""
+    tagged = entities_by_tag.get(tag)
+    if tagged is not None:
+        tagged.pop(entity.id, None)
+        if not tagged:
+            del entities_by_tag[tag]
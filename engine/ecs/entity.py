@@ -2,8 +2,10 @@
 """
 Entity and EntityManager for ECS implementation
 """
+from collections import defaultdict
 from typing import Dict, List, Set, Optional, Type, TypeVar
 import uuid
+from .components import TagComponent, _index_tag, _unindex_tag
 
 T = TypeVar('T')
 
@@ -29,6 +31,7 @@ class EntityManager:
         self.entities: Dict[str, Entity] = {}
         self.components: Dict[str, Dict[Type, object]] = {}  # entity_id -> {component_type: component}
         self.component_index: Dict[Type, Set[str]] = {}  # component_type -> set of entity_ids
+        self.entities_by_tag: Dict[str, Dict[str, Entity]] = defaultdict(dict)  # tag -> {entity_id: entity}
         
     def create_entity(self, entity_id: str = None) -> Entity:
         """Create a new entity"""
@@ -67,6 +70,12 @@ class EntityManager:
         # Set entity reference if component supports it
         if hasattr(component, 'entity'):
             component.entity = entity
+        
+        # Index tags, and keep the index in sync with later add_tag/remove_tag calls
+        if component_type is TagComponent:
+            component.tag_index = self.entities_by_tag
+            for tag in component.tags:
+                _index_tag(self.entities_by_tag, tag, entity)
             
         return component
     
@@ -90,6 +99,11 @@ class EntityManager:
             # Remove from entity
             del self.components[entity.id][component_type]
             
+            if component_type is TagComponent:
+                for tag in component.tags:
+                    _unindex_tag(self.entities_by_tag, tag, entity)
+                component.tag_index = None
+            
             # Update index
             if component_type in self.component_index:
                 self.component_index[component_type].discard(entity.id)
@@ -119,6 +133,11 @@ class EntityManager:
         
         return [self.entities[entity_id] for entity_id in result_ids if entity_id in self.entities]
     
+    def get_entities_with_tag(self, tag: str) -> List[Entity]:
+        """Get all entities whose TagComponent has a specific tag"""
+        tagged = self.entities_by_tag.get(tag)
+        return list(tagged.values()) if tagged else []
+    
     def get_all_entities(self) -> List[Entity]:
         """Get all entities"""
         return list(self.entities.values())
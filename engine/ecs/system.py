@@ -2,7 +2,8 @@
 """
 System and SystemManager for ECS implementation
 """
-from typing import List, Dict, Type, Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Type, Optional, FrozenSet, TYPE_CHECKING
 from abc import ABC, abstractmethod
 
 if TYPE_CHECKING:
@@ -12,6 +13,11 @@ if TYPE_CHECKING:
 class System(ABC):
     """Base system class for ECS"""
     
+    # Component types the system reads and writes. None means unknown, so the system
+    # never shares a parallel stage with another (see SystemManager.set_max_workers).
+    reads: Optional[FrozenSet[Type]] = None
+    writes: Optional[FrozenSet[Type]] = None
+    
     def __init__(self, priority: int = 0):
         self.priority = priority
         self.is_active = True
@@ -37,6 +43,20 @@ class SystemManager:
     def __init__(self):
         self.systems: List[System] = []
         self.systems_by_type: Dict[Type, System] = {}
+        
+        # Parallel stages, used only when max_workers > 1
+        self.max_workers = 1
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stages: Optional[List[List[System]]] = None
+    
+    def set_max_workers(self, max_workers: int):
+        """Run independent systems on up to max_workers threads (1 runs everything serially)"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self.max_workers = max(1, max_workers)
+        if self.max_workers > 1:
+            self._executor = ThreadPoolExecutor(self.max_workers - 1)
     
     def add_system(self, system: System):
         """Add a system"""
@@ -52,6 +72,7 @@ class SystemManager:
         
         # Sort by priority
         self.systems.sort(key=lambda s: s.priority)
+        self._stages = None
         
         # Initialize system
         system.start()
@@ -67,14 +88,30 @@ class SystemManager:
             system.stop()
             self.systems.remove(system)
             del self.systems_by_type[system_type]
+            self._stages = None
             return True
         return False
     
     def update(self, delta_time: float):
         """Update all active systems"""
-        for system in self.systems:
-            if system.is_active:
-                system.update(delta_time)
+        if self._executor is None:
+            for system in self.systems:
+                if system.is_active:
+                    system.update(delta_time)
+            return
+        
+        if self._stages is None:
+            self._stages = _build_stages(self.systems)
+        
+        for stage in self._stages:
+            active = [system for system in stage if system.is_active]
+            if not active:
+                continue
+            # The first system runs on the calling thread, the rest on the pool
+            futures = [self._executor.submit(system.update, delta_time) for system in active[1:]]
+            active[0].update(delta_time)
+            for future in futures:
+                future.result()
     
     def clear(self):
         """Remove all systems"""
@@ -82,3 +119,37 @@ class SystemManager:
             system.stop()
         self.systems.clear()
         self.systems_by_type.clear()
+        self._stages = None
+    
+    def shutdown(self):
+        """Release the worker threads, running systems serially until set_max_workers is called again"""
+        self.set_max_workers(1)
+
+
+def _build_stages(systems: List[System]) -> List[List[System]]:
+    """Group consecutive systems (in priority order) whose component access does not conflict"""
+    stages: List[List[System]] = []
+    stage: List[System] = []
+    stage_exclusive = False
+    reads = set()
+    writes = set()
+    
+    for system in systems:
+        exclusive = system.reads is None or system.writes is None
+        if stage and (exclusive or stage_exclusive or
+                      not writes.isdisjoint(system.reads) or
+                      not (reads | writes).isdisjoint(system.writes)):
+            stages.append(stage)
+            stage = []
+            reads = set()
+            writes = set()
+        
+        stage.append(system)
+        stage_exclusive = exclusive
+        if not exclusive:
+            reads |= system.reads
+            writes |= system.writes
+    
+    if stage:
+        stages.append(stage)
+    return stages
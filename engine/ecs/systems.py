@@ -10,23 +10,31 @@ from ..math.vector2 import Vector2
 class MovementSystem(System):
     """System that handles movement using velocity"""
     
+    reads = frozenset((TransformComponent, VelocityComponent))
+    writes = frozenset((TransformComponent, VelocityComponent))
+    
     def __init__(self, priority: int = 100):
         super().__init__(priority)
     
     def update(self, delta_time: float):
         """Update entity positions based on velocity"""
         entities = self.world.get_entities_with_components(TransformComponent, VelocityComponent)
+        get_component = self.world.get_component
         
         for entity in entities:
-            transform = self.world.get_component(entity, TransformComponent)
-            velocity = self.world.get_component(entity, VelocityComponent)
+            transform = get_component(entity, TransformComponent)
+            velocity = get_component(entity, VelocityComponent)
             
             if transform and velocity:
                 # Limit speed if max_speed is set
                 velocity.limit_speed()
                 
-                # Update position
-                transform.translate(velocity.velocity * delta_time)
+                # Integrate the position in place instead of building a scaled velocity vector
+                v = velocity.velocity
+                position = transform.position
+                position.x += v.x * delta_time
+                position.y += v.y * delta_time
+                transform.transform.position = position
 
 
 class RenderSystem(System):
@@ -100,6 +108,9 @@ class TimerSystem(System):
 class BoundarySystem(System):
     """System that keeps entities within screen boundaries"""
     
+    reads = frozenset((TransformComponent,))
+    writes = frozenset((TransformComponent,))
+    
     def __init__(self, screen_width: int = 800, screen_height: int = 600, wrap_around: bool = True, priority: int = 150):
         super().__init__(priority)
         self.screen_width = screen_width
@@ -109,25 +120,23 @@ class BoundarySystem(System):
     def update(self, delta_time: float):
         """Keep entities within boundaries"""
         entities = self.world.get_entities_with_component(TransformComponent)
+        get_component = self.world.get_component
+        width = float(self.screen_width)
+        height = float(self.screen_height)
         
         for entity in entities:
-            transform = self.world.get_component(entity, TransformComponent)
+            transform = get_component(entity, TransformComponent)
             
             if transform:
                 pos = transform.position
                 
                 if self.wrap_around:
                     # Wrap around screen
-                    if pos.x < 0:
-                        pos.x = self.screen_width
-                    elif pos.x > self.screen_width:
-                        pos.x = 0
-                    
-                    if pos.y < 0:
-                        pos.y = self.screen_height
-                    elif pos.y > self.screen_height:
-                        pos.y = 0
+                    pos.x %= width
+                    pos.y %= height
                 else:
                     # Clamp to boundaries
-                    pos.x = max(0, min(self.screen_width, pos.x))
-                    pos.y = max(0, min(self.screen_height, pos.y))
+                    x = pos.x
+                    y = pos.y
+                    pos.x = 0.0 if x < 0.0 else (width if x > width else x)
+                    pos.y = 0.0 if y < 0.0 else (height if y > height else y)
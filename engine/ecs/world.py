@@ -55,6 +55,10 @@ class World:
         """Get all entities with all specified components"""
         return self.entity_manager.get_entities_with_components(*component_types)
     
+    def get_entities_with_tag(self, tag: str) -> List[Entity]:
+        """Get all entities tagged with a specific tag"""
+        return self.entity_manager.get_entities_with_tag(tag)
+    
     # System methods
     def add_system(self, system: System):
         """Add a system"""
@@ -69,6 +73,14 @@ class World:
         """Remove a system"""
         return self.system_manager.remove_system(system_type)
     
+    def set_max_workers(self, max_workers: int):
+        """Run systems with non-conflicting reads/writes on up to max_workers threads"""
+        self.system_manager.set_max_workers(max_workers)
+    
+    def shutdown(self):
+        """Release the system worker threads (systems then run serially)"""
+        self.system_manager.shutdown()
+    
     # Update
     def update(self, delta_time: float):
         """Update the world"""
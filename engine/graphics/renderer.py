@@ -3,7 +3,7 @@ The text rendering function `draw_text` is updated to include font style and anc
 """
 import math
 from tkinter import Canvas
-from typing import Tuple, Optional, Dict, List
+from typing import Tuple, Optional, Dict, List, Sequence
 from ..math.vector2 import Vector2
 
 
@@ -15,6 +15,9 @@ class Renderer:
         self.width = int(canvas['width'])
         self.height = int(canvas['height'])
 
+        # Visible area (x0, y0, x1, y1) used to cull off-screen draws
+        self.viewport_aabb = (0.0, 0.0, float(self.width), float(self.height))
+
         # Shader system
         self.active_shaders: List[str] = []
         self.shader_uniforms: Dict[str, any] = {}
@@ -24,6 +27,26 @@ class Renderer:
         self.render_layers: Dict[int, List] = {}
         self.current_layer = 0
 
+        # Queued Tcl canvas commands while batching (see begin_batch)
+        self._batch: Optional[List[str]] = None
+        self._canvas_path = str(canvas)
+
+    def begin_batch(self):
+        """Queue shape draws until end_batch() submits them to Tk in a single call"""
+        self._batch = []
+
+    def end_batch(self):
+        """Submit all queued draws and stop batching"""
+        self._flush_batch()
+        self._batch = None
+
+    def _flush_batch(self):
+        """Submit queued draws as one Tcl script, keeping their order"""
+        batch = self._batch
+        if batch:
+            self.canvas.tk.eval('\n'.join(batch))
+            batch.clear()
+
     def draw_rectangle(self, position: Vector2, size: Vector2, color: str = '#FFFFFF', 
                       rotation: float = 0.0, outline: str = None, width: int = 1):
         """Draw a rectangle"""
@@ -34,6 +57,11 @@ class Renderer:
             x2 = position.x + size.x / 2
             y2 = position.y + size.y / 2
 
+            if self._batch is not None:
+                self._batch.append(
+                    f"{self._canvas_path} create rectangle {x1!r} {y1!r} {x2!r} {y2!r} "
+                    f"-fill {{{color}}} -outline {{{outline or color}}} -width {width}")
+                return None
             return self.canvas.create_rectangle(
                 x1, y1, x2, y2,
                 fill=color,
@@ -60,6 +88,9 @@ class Renderer:
                 world_pos = position + rotated
                 rotated_corners.extend([world_pos.x, world_pos.y])
 
+            if self._batch is not None:
+                self._queue_polygon(rotated_corners, color, outline, width)
+                return None
             return self.canvas.create_polygon(
                 rotated_corners,
                 fill=color,
@@ -75,6 +106,11 @@ class Renderer:
         x2 = position.x + radius
         y2 = position.y + radius
 
+        if self._batch is not None:
+            self._batch.append(
+                f"{self._canvas_path} create oval {x1!r} {y1!r} {x2!r} {y2!r} "
+                f"-fill {{{color}}} -outline {{{outline or color}}} -width {width}")
+            return None
         return self.canvas.create_oval(
             x1, y1, x2, y2,
             fill=color,
@@ -82,8 +118,26 @@ class Renderer:
             width=width
         )
 
+    def draw_circles(self, xs: Sequence[float], ys: Sequence[float], radii: Sequence[float],
+                     colors: Sequence[str]):
+        """Draw many filled circles (parallel sequences of centers, radii and colors) in one call"""
+        path = self._canvas_path
+        commands = [
+            f"{path} create oval {x - r!r} {y - r!r} {x + r!r} {y + r!r} -fill {{{c}}} -outline {{{c}}} -width 1"
+            for x, y, r, c in zip(xs, ys, radii, colors)
+        ]
+        if self._batch is not None:
+            self._batch.extend(commands)
+        elif commands:
+            self.canvas.tk.eval('\n'.join(commands))
+
     def draw_line(self, start: Vector2, end: Vector2, color: str = '#FFFFFF', width: int = 1):
         """Draw a line"""
+        if self._batch is not None:
+            self._batch.append(
+                f"{self._canvas_path} create line {start.x!r} {start.y!r} {end.x!r} {end.y!r} "
+                f"-fill {{{color}}} -width {width}")
+            return None
         return self.canvas.create_line(
             start.x, start.y, end.x, end.y,
             fill=color,
@@ -92,6 +146,8 @@ class Renderer:
 
     def draw_text(self, position: Vector2, text: str, color: str = '#FFFFFF', font_size: int = 12, anchor: str = 'center'):
         """Draw text at position with improved formatting"""
+        # Text is not queued (it would need Tcl quoting), so submit earlier draws first
+        self._flush_batch()
         self.canvas.create_text(
             position.x, position.y,
             text=text,
@@ -107,6 +163,9 @@ class Renderer:
         for point in points:
             coords.extend([point.x, point.y])
 
+        if self._batch is not None:
+            self._queue_polygon(coords, color, outline, width)
+            return None
         return self.canvas.create_polygon(
             coords,
             fill=color,
@@ -114,8 +173,16 @@ class Renderer:
             width=width
         )
 
+    def _queue_polygon(self, coords: list, color: str, outline: Optional[str], width: int):
+        """Queue a polygon draw while batching"""
+        self._batch.append(
+            f"{self._canvas_path} create polygon {' '.join(map(repr, coords))} "
+            f"-fill {{{color}}} -outline {{{outline or color}}} -width {width}")
+
     def clear(self):
         """Clear all drawn objects"""
+        if self._batch:
+            self._batch.clear()
         self.canvas.delete("all")
 
     def get_size(self) -> Vector2:
@@ -1,13 +1,31 @@
 """
 Sprite component for rendering 2D shapes and images
 """
+import math
 import time
-from typing import Optional, Tuple, List, Dict
+from array import array
+from typing import Optional, Tuple, List, Dict, Sequence
 from ..scene.game_object import Component
 from ..math.vector2 import Vector2
 from .renderer import Renderer
 
 
+# Shader effect flags stored in the top byte of Sprite._effects_packed.
+# Layout: [flags:8 | brightness_q8:8 | contrast_q8:8 | tint_rgb:24]
+EFFECT_TINT = 0x01
+EFFECT_BRIGHTNESS = 0x02
+EFFECT_CONTRAST = 0x04
+EFFECT_CUSTOM = 0x08
+
+_TINT_MASK = 0xFFFFFF
+_CONTRAST_SHIFT = 24
+_BRIGHTNESS_SHIFT = 32
+_FLAGS_SHIFT = 40
+
+# Effects that currently change the rendered color
+_COLOR_EFFECT_MASK = EFFECT_TINT << _FLAGS_SHIFT
+
+
 class SpriteAnimation:
     """Animation data for sprites"""
     
@@ -17,28 +35,38 @@ class SpriteAnimation:
         self.frame_duration = frame_duration
         self.loop = loop
         self.current_frame = 0
-        self.frame_timer = 0.0
+        self.frame_timer = 0.0  # Time spent on the current frame
+        self.elapsed = 0.0  # Time into the current loop
         self.is_playing = False
+        # Atlas sprite name for each frame, built once instead of formatted every update
+        self.frame_names = [f"{name}_frame_{index}" for index in frame_indices]
     
     def update(self, delta_time: float) -> int:
         """Update animation and return current frame index"""
         if not self.is_playing or not self.frame_indices:
             return self.frame_indices[0] if self.frame_indices else 0
         
-        self.frame_timer += delta_time
+        # Frames are evenly spaced, so the current frame follows directly from the elapsed time
+        frame_duration = self.frame_duration
+        frame_count = len(self.frame_indices)
+        self.elapsed += delta_time
+        if frame_duration > 0:
+            frame = int(self.elapsed / frame_duration)
+        else:
+            frame = self.current_frame + 1
         
-        if self.frame_timer >= self.frame_duration:
-            self.frame_timer = 0.0
-            self.current_frame += 1
-            
-            if self.current_frame >= len(self.frame_indices):
-                if self.loop:
-                    self.current_frame = 0
-                else:
-                    self.current_frame = len(self.frame_indices) - 1
-                    self.is_playing = False
+        if frame >= frame_count:
+            if self.loop:
+                frame %= frame_count
+                if frame_duration > 0:
+                    self.elapsed %= frame_count * frame_duration
+            else:
+                frame = frame_count - 1
+                self.is_playing = False
         
-        return self.frame_indices[self.current_frame]
+        self.current_frame = frame
+        self.frame_timer = self.elapsed - frame * frame_duration
+        return self.frame_indices[frame]
     
     def play(self):
         """Start playing the animation"""
@@ -49,6 +77,7 @@ class SpriteAnimation:
         self.is_playing = False
         self.current_frame = 0
         self.frame_timer = 0.0
+        self.elapsed = 0.0
     
     def pause(self):
         """Pause the animation"""
@@ -102,7 +131,7 @@ class Sprite(Component):
         super().__init__()
         self.color = color
         self.size = size or Vector2(50, 50)
-        self.shape = shape  # 'rectangle', 'circle', 'triangle'
+        self.set_shape(shape)  # 'rectangle', 'circle', 'triangle'
         self.outline_color: Optional[str] = None
         self.outline_width = 1
         self.visible = True
@@ -114,12 +143,34 @@ class Sprite(Component):
         self.sprite_atlas: Optional[SpriteAtlas] = None
         self.current_sprite_name: Optional[str] = None
         
-        # Shader effects
+        # Shader effects (packed into one int so render can test them with a single AND)
         self.shader_effects: Dict[str, any] = {}
-        self.tint_color: Optional[str] = None
-        self.brightness = 1.0
-        self.contrast = 1.0
+        self._tint_color: Optional[str] = None
+        self._brightness = 1.0
+        self._contrast = 1.0
+        self._effects_packed = self._quantize(1.0) << _BRIGHTNESS_SHIFT | self._quantize(1.0) << _CONTRAST_SHIFT
         
+    @property
+    def shape(self) -> str:
+        """Get the sprite shape"""
+        return self._shape
+    
+    @shape.setter
+    def shape(self, shape: str):
+        """Set the sprite shape"""
+        self.set_shape(shape)
+    
+    def set_shape(self, shape: str):
+        """Set the sprite shape and bind its render routine"""
+        self._shape = shape
+        if shape == 'circle':
+            self._render_impl = self._render_circle
+        elif shape == 'triangle':
+            self._render_impl = self._render_triangle
+        else:
+            # Default to rectangle
+            self._render_impl = self._render_rectangle
+    
     def set_color(self, color: str):
         """Set the sprite color"""
         self.color = color
@@ -166,6 +217,50 @@ class Sprite(Component):
         if self.sprite_atlas and sprite_name in self.sprite_atlas.sprites:
             self.current_sprite_name = sprite_name
     
+    @property
+    def tint_color(self) -> Optional[str]:
+        """Get tint color"""
+        return self._tint_color
+    
+    @tint_color.setter
+    def tint_color(self, color: Optional[str]):
+        """Set tint color and update the packed effect state"""
+        self._tint_color = color
+        rgb = 0
+        if color and color.startswith('#') and len(color) == 7:
+            try:
+                rgb = int(color[1:], 16)
+            except ValueError:
+                rgb = 0
+        packed = self._effects_packed & ~_TINT_MASK | rgb
+        self._effects_packed = self._set_effect_flag(packed, EFFECT_TINT, bool(color))
+    
+    @property
+    def brightness(self) -> float:
+        """Get brightness"""
+        return self._brightness
+    
+    @brightness.setter
+    def brightness(self, brightness: float):
+        """Set brightness and update the packed effect state"""
+        self._brightness = brightness
+        packed = self._effects_packed & ~(0xFF << _BRIGHTNESS_SHIFT)
+        packed |= self._quantize(brightness) << _BRIGHTNESS_SHIFT
+        self._effects_packed = self._set_effect_flag(packed, EFFECT_BRIGHTNESS, brightness != 1.0)
+    
+    @property
+    def contrast(self) -> float:
+        """Get contrast"""
+        return self._contrast
+    
+    @contrast.setter
+    def contrast(self, contrast: float):
+        """Set contrast and update the packed effect state"""
+        self._contrast = contrast
+        packed = self._effects_packed & ~(0xFF << _CONTRAST_SHIFT)
+        packed |= self._quantize(contrast) << _CONTRAST_SHIFT
+        self._effects_packed = self._set_effect_flag(packed, EFFECT_CONTRAST, contrast != 1.0)
+    
     def set_tint(self, color: str):
         """Set tint color for shader effect"""
         self.tint_color = color
@@ -181,11 +276,31 @@ class Sprite(Component):
     def add_shader_effect(self, name: str, effect_data: any):
         """Add a custom shader effect"""
         self.shader_effects[name] = effect_data
+        self._effects_packed = self._set_effect_flag(self._effects_packed, EFFECT_CUSTOM, True)
     
     def remove_shader_effect(self, name: str):
         """Remove a shader effect"""
         if name in self.shader_effects:
             del self.shader_effects[name]
+        self._effects_packed = self._set_effect_flag(
+            self._effects_packed, EFFECT_CUSTOM, bool(self.shader_effects)
+        )
+    
+    def has_shader_effect(self, flag: int) -> bool:
+        """Check whether an EFFECT_* flag is active"""
+        return bool(self._effects_packed >> _FLAGS_SHIFT & flag)
+    
+    @staticmethod
+    def _quantize(value: float) -> int:
+        """Quantize a 0.0-2.0 effect value to 8 bits"""
+        return int(round(max(0.0, min(2.0, value)) * 127.5))
+    
+    @staticmethod
+    def _set_effect_flag(packed: int, flag: int, enabled: bool) -> int:
+        """Return packed effect state with an EFFECT_* flag set or cleared"""
+        if enabled:
+            return packed | flag << _FLAGS_SHIFT
+        return packed & ~(flag << _FLAGS_SHIFT)
     
     def get_size(self) -> Vector2:
         """Get the size of the sprite"""
@@ -209,8 +324,9 @@ class Sprite(Component):
         if self.shape == 'circle':
             # Circle collision
             radius = max(actual_size.x, actual_size.y) / 2
-            distance = point.distance_to(world_pos)
-            return distance <= radius
+            dx = point.x - world_pos.x
+            dy = point.y - world_pos.y
+            return dx * dx + dy * dy <= radius * radius
         else:
             # Rectangle collision (simplified - no rotation)
             half_w = actual_size.x / 2
@@ -221,17 +337,18 @@ class Sprite(Component):
     
     def update(self, delta_time: float):
         """Update sprite animations"""
-        if self.current_animation:
-            frame_index = self.current_animation.update(delta_time)
+        animation = self.current_animation
+        if animation:
+            animation.update(delta_time)
             # If using atlas, update current sprite based on animation frame
-            if self.sprite_atlas and self.current_animation.frame_indices:
-                frame_name = f"{self.current_animation.name}_frame_{frame_index}"
+            if self.sprite_atlas and animation.frame_indices:
+                frame_name = animation.frame_names[animation.current_frame]
                 if frame_name in self.sprite_atlas.sprites:
                     self.current_sprite_name = frame_name
     
     def render(self, renderer: Renderer):
         """Render the sprite"""
-        if not self.visible or not self.game_object:
+        if not self.visible or not self.game_object or self.alpha <= 0.0:
             return
         
         # Get world transform
@@ -256,54 +373,84 @@ class Sprite(Component):
             render_size.y * world_scale.y
         )
         
+        # Cull sprites that lie entirely outside the viewport
+        half_w = actual_size.x / 2
+        half_h = actual_size.y / 2
+        if self._shape == 'circle':
+            # Circles are drawn with the larger half extent as their radius, whatever the rotation
+            half_w = half_h = max(half_w, half_h)
+        elif world_rotation != 0:
+            # Rotated shapes can reach out to their half diagonal
+            half_w = half_h = math.hypot(half_w, half_h)
+        
+        x0 = world_pos.x - half_w
+        y0 = world_pos.y - half_h
+        x1 = world_pos.x + half_w
+        y1 = world_pos.y + half_h
+        vp_x0, vp_y0, vp_x1, vp_y1 = renderer.viewport_aabb
+        if x1 < vp_x0 or x0 > vp_x1 or y1 < vp_y0 or y0 > vp_y1:
+            return
+        
         # Apply shader effects
         final_color = self._apply_shader_effects(render_color)
         
-        # Render based on shape
-        if self.shape == 'circle':
-            radius = max(actual_size.x, actual_size.y) / 2
-            renderer.draw_circle(
-                world_pos, radius, final_color,
-                self.outline_color, self.outline_width
-            )
-        elif self.shape == 'triangle':
-            # Draw triangle as polygon
-            half_w = actual_size.x / 2
-            half_h = actual_size.y / 2
-            
-            # Triangle points (local coordinates)
-            points = [
-                Vector2(0, -half_h),      # Top
-                Vector2(-half_w, half_h), # Bottom left
-                Vector2(half_w, half_h)   # Bottom right
-            ]
-            
-            # Rotate and translate points
-            world_points = []
-            for point in points:
-                rotated = point.rotate(world_rotation)
-                world_point = world_pos + rotated
-                world_points.append(world_point)
-            
-            renderer.draw_polygon(
-                world_points, final_color,
-                self.outline_color, self.outline_width
-            )
-        else:
-            # Default to rectangle
-            renderer.draw_rectangle(
-                world_pos, actual_size, final_color,
-                world_rotation, self.outline_color, self.outline_width
-            )
+        # Draw with the shape-specific routine bound in set_shape()
+        self._render_impl(renderer, world_pos, world_rotation, actual_size, final_color)
+    
+    def _render_rectangle(self, renderer: Renderer, world_pos: Vector2, world_rotation: float,
+                          actual_size: Vector2, final_color: str):
+        """Draw the sprite as a rectangle"""
+        renderer.draw_rectangle(
+            world_pos, actual_size, final_color,
+            world_rotation, self.outline_color, self.outline_width
+        )
+    
+    def _render_circle(self, renderer: Renderer, world_pos: Vector2, world_rotation: float,
+                       actual_size: Vector2, final_color: str):
+        """Draw the sprite as a circle"""
+        radius = max(actual_size.x, actual_size.y) / 2
+        renderer.draw_circle(
+            world_pos, radius, final_color,
+            self.outline_color, self.outline_width
+        )
+    
+    def _render_triangle(self, renderer: Renderer, world_pos: Vector2, world_rotation: float,
+                         actual_size: Vector2, final_color: str):
+        """Draw the sprite as a triangle polygon"""
+        half_w = actual_size.x / 2
+        half_h = actual_size.y / 2
+        
+        # Triangle points (local coordinates)
+        points = [
+            Vector2(0, -half_h),      # Top
+            Vector2(-half_w, half_h), # Bottom left
+            Vector2(half_w, half_h)   # Bottom right
+        ]
+        
+        # Rotate and translate points
+        world_points = []
+        for point in points:
+            rotated = point.rotate(world_rotation)
+            world_point = world_pos + rotated
+            world_points.append(world_point)
+        
+        renderer.draw_polygon(
+            world_points, final_color,
+            self.outline_color, self.outline_width
+        )
     
     def _apply_shader_effects(self, base_color: str) -> str:
         """Apply shader effects to the base color"""
+        # Most sprites have no color-changing effects
+        if not self._effects_packed & _COLOR_EFFECT_MASK:
+            return base_color
+        
         # Simple shader effect simulation
         color = base_color
         
         # Apply tint
-        if self.tint_color:
-            color = self._blend_colors(color, self.tint_color, 0.5)
+        if self._tint_color:
+            color = self._blend_colors(color, self._tint_color, 0.5)
         
         # Brightness and contrast would typically be applied in a real shader
         # For simplicity, we'll just return the color
@@ -313,4 +460,48 @@ class Sprite(Component):
         """Simple color blending (simplified implementation)"""
         # In a real implementation, this would properly blend RGB values
         # For now, just return the tint color if factor > 0.5, else base color
-        return color2 if factor > 0.5 else color1
\ No newline at end of file
+        return color2 if factor > 0.5 else color1
+
+
+# Shape codes used by the packed hit-test buffers
+SHAPE_RECT = 0
+SHAPE_CIRCLE = 1
+
+
+def pack_sprite_bounds(sprites: Sequence[Sprite]) -> Tuple[array, array, array]:
+    """Pack sprite world positions, sizes and shape codes into flat arrays for hit_test"""
+    positions = array('d')
+    sizes = array('d')
+    shapes = array('b')
+    
+    for sprite in sprites:
+        transform = sprite.game_object.transform
+        world_pos = transform.world_position
+        world_scale = transform.world_scale
+        positions.append(world_pos.x)
+        positions.append(world_pos.y)
+        sizes.append(sprite.size.x * world_scale.x)
+        sizes.append(sprite.size.y * world_scale.y)
+        shapes.append(SHAPE_CIRCLE if sprite.shape == 'circle' else SHAPE_RECT)
+    
+    return positions, sizes, shapes
+
+
+def hit_test(px: float, py: float, positions: array, sizes: array, shapes: array) -> int:
+    """Return the index of the first packed sprite containing (px, py), or -1"""
+    for i in range(len(shapes)):
+        j = i + i
+        dx = px - positions[j]
+        dy = py - positions[j + 1]
+        w = sizes[j]
+        h = sizes[j + 1]
+        
+        if shapes[i] == SHAPE_RECT:
+            if abs(dx) <= w * 0.5 and abs(dy) <= h * 0.5:
+                return i
+        else:
+            r = (w if w > h else h) * 0.5
+            if dx * dx + dy * dy <= r * r:
+                return i
+    
+    return -1
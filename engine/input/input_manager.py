@@ -1,23 +1,221 @@
 """
 Input management system for handling keyboard, mouse, and gamepad input
+
+Frame ordering: the window presents the frame, sleeps to hold the target
+frame rate, and only then pumps tkinter events. The engine then calls
+drain_events() and snapshot_frame_state() right before the next simulation
+step. Polling after the throttle instead of before it keeps input that
+arrives during the sleep from going stale by a whole frame (the same
+restructure MAME used to remove a frame of input lag).
 """
-from typing import Set, Dict, Tuple, Optional, Callable
+from collections import deque
+from typing import Deque, Dict, Tuple, Optional, Callable, Iterator, List
 from ..math.vector2 import Vector2
+import math
+import sys
 import time
 
 
+# Bit index assigned to every key name. Key, mouse button and gamepad button
+# state is stored as int bitsets with one bit per key/button, so copies are
+# plain assignments and edge detection is a couple of AND/NOT operations.
+_DEFAULT_KEY_NAMES = (
+    ['up', 'down', 'left', 'right', 'space', 'escape', 'f11']
+    + [chr(c) for c in range(ord('a'), ord('z') + 1)]
+    + [chr(c) for c in range(ord('0'), ord('9') + 1)]
+)
+KEY_NAMES: List[str] = list(_DEFAULT_KEY_NAMES)
+KEY_INDEX: Dict[str, int] = {name: index for index, name in enumerate(KEY_NAMES)}
+
+# Pre-lowered key and action names; passing these skips normalization entirely
+KEY_UP = 'up'
+KEY_DOWN = 'down'
+KEY_LEFT = 'left'
+KEY_RIGHT = 'right'
+KEY_W = 'w'
+KEY_A = 'a'
+KEY_S = 's'
+KEY_D = 'd'
+KEY_Q = 'q'
+KEY_E = 'e'
+KEY_SPACE = 'space'
+KEY_ESCAPE = 'escape'
+
+ACTION_MOVE_UP = 'move_up'
+ACTION_MOVE_DOWN = 'move_down'
+ACTION_MOVE_LEFT = 'move_left'
+ACTION_MOVE_RIGHT = 'move_right'
+ACTION_ROTATE_LEFT = 'rotate_left'
+ACTION_ROTATE_RIGHT = 'rotate_right'
+ACTION_ACTION = 'action'
+ACTION_PAUSE = 'pause'
+
+# Bit indices read by the movement helpers every frame
+_IDX_UP, _IDX_DOWN, _IDX_LEFT, _IDX_RIGHT = (KEY_INDEX[k] for k in ('up', 'down', 'left', 'right'))
+_IDX_W, _IDX_A, _IDX_S, _IDX_D = (KEY_INDEX[k] for k in ('w', 'a', 's', 'd'))
+
+
+def _build_direction_table() -> List[Tuple[float, float]]:
+    """Normalized (x, y) movement for every up/down/left/right combination (bits 0-3)"""
+    table = []
+    for nibble in range(16):
+        x = float((nibble >> 3 & 1) - (nibble >> 2 & 1))
+        y = float((nibble >> 1 & 1) - (nibble & 1))
+        if x and y:
+            x *= math.sqrt(0.5)
+            y *= math.sqrt(0.5)
+        table.append((x, y))
+    return table
+
+
+_DIRECTION_TABLE = _build_direction_table()
+
+
+def _movement_from_bits(bits: int) -> Tuple[float, float]:
+    """Movement from arrow keys, or WASD if the arrows cancel out, for a key bitset"""
+    # The arrow keys are the first four KEY_NAMES entries, so they already form the nibble
+    x, y = _DIRECTION_TABLE[bits & 0xF]
+    if x == 0.0 and y == 0.0:
+        x, y = _DIRECTION_TABLE[(bits >> _IDX_W & 1) | (bits >> _IDX_S & 1) << 1 |
+                                (bits >> _IDX_A & 1) << 2 | (bits >> _IDX_D & 1) << 3]
+    return x, y
+
+
+# Memoized str.lower() results for names passed to the query methods
+_LOWER_CACHE: Dict[str, str] = {}
+_LOWER_CACHE_LIMIT = 256
+
+
+def _lower(name: str) -> str:
+    """Lowercase a key/button name, reusing the result for repeated queries"""
+    lowered = _LOWER_CACHE.get(name)
+    if lowered is None:
+        # Interned so repeated lookups of the same name compare by identity in KEY_INDEX
+        lowered = sys.intern(name.lower())
+        if len(_LOWER_CACHE) < _LOWER_CACHE_LIMIT:
+            _LOWER_CACHE[name] = lowered
+    return lowered
+
+
+
+# Tk keysym -> engine key name. Each keysym is also registered in lowercase so
+# the common spellings resolve with one dict hit; anything else goes through _lower()
+_TK_KEYSYM_NAMES: Dict[str, str] = {
+    'Up': 'up', 'Down': 'down', 'Left': 'left', 'Right': 'right',
+    'w': 'w', 'a': 'a', 's': 's', 'd': 'd', 'q': 'q', 'e': 'e',
+    'space': 'space', 'Escape': 'escape', 'F11': 'f11'
+}
+_DEFAULT_KEY_MAP: Dict[str, str] = {keysym.lower(): name for keysym, name in _TK_KEYSYM_NAMES.items()}
+_DEFAULT_KEY_MAP.update(_TK_KEYSYM_NAMES)
+
+def _key_index(key: str) -> int:
+    """Get the bit index for a key name, assigning a new one for unseen keys"""
+    index = KEY_INDEX.get(key)
+    if index is None:
+        index = len(KEY_NAMES)
+        KEY_NAMES.append(key)
+        KEY_INDEX[key] = index
+    return index
+
+
+# Standard gamepad button names and the reverse lookup used by input profiles
+GAMEPAD_BUTTON_NAMES: Dict[int, str] = {
+    0: 'a', 1: 'b', 2: 'x', 3: 'y',
+    4: 'left_bumper', 5: 'right_bumper',
+    6: 'back', 7: 'start',
+    8: 'left_stick_button', 9: 'right_stick_button',
+    12: 'dpad_up', 13: 'dpad_down', 14: 'dpad_left', 15: 'dpad_right'
+}
+BUTTON_NAME_TO_ID: Dict[str, int] = {name: btn_id for btn_id, name in GAMEPAD_BUTTON_NAMES.items()}
+
+# Number of gamepad slots; every gamepad owns a 16-bit slice of the packed button bitsets (pad N at bits 16*N..16*N+15)
+MAX_GAMEPADS = 4
+GAMEPAD_BUTTON_COUNT = 16
+_GAMEPAD_BUTTON_MASK = (1 << GAMEPAD_BUTTON_COUNT) - 1
+# Bit 0 of every pad's slice for the 4 supported pads; shift left by a button id to test all pads at once
+_ALL_GAMEPADS_BIT0 = 0x0001000100010001
+
+
+def _gamepad_button_id(button: str) -> int:
+    """Convert a gamepad button name or number to a button id (-1 if unknown)"""
+    button_id = BUTTON_NAME_TO_ID.get(button)
+    if button_id is None:
+        if not button.isdigit():
+            return -1
+        button_id = int(button)
+        if button_id >= GAMEPAD_BUTTON_COUNT:
+            return -1
+    return button_id
+
+
+# Mouse button names understood by input profiles
+_MOUSE_BUTTON_CODES: Dict[str, int] = {'left': 1, 'middle': 2, 'right': 3}
+
+# Button name or code -> code for the mouse queries (ints map to themselves)
+_MOUSE_BUTTON_MAP: Dict[object, int] = {'left': 1, 'middle': 2, 'right': 3, 1: 1, 2: 2, 3: 3}
+
+# Shared zero stick handed out by the read-only stick accessor; never mutate
+_ZERO_STICK = Vector2.ZERO
+
+
+def iter_bitvec(bits: int) -> Iterator[int]:
+    """Yield the index of every set bit (for debug dumps)"""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+class GamepadButtonBits:
+    """Packed button bitsets shared by a set of gamepads, 16 bits per pad"""
+    
+    __slots__ = ('pressed', 'just_pressed', 'just_released', 'previous')
+    
+    def __init__(self):
+        self.pressed = 0
+        self.just_pressed = 0
+        self.just_released = 0
+        self.previous = 0
+    
+    def update(self):
+        """Compute just pressed/released for every pad against last frame's state"""
+        pressed = self.pressed
+        previous = self.previous
+        self.just_pressed = pressed & ~previous
+        self.just_released = previous & ~pressed
+        self.previous = pressed
+
+
+def _button_slice(field: str) -> property:
+    """Property exposing one gamepad's 16-bit slice of a packed GamepadButtonBits field"""
+    def get(self) -> int:
+        return getattr(self._bits, field) >> self._shift & _GAMEPAD_BUTTON_MASK
+    
+    def set(self, value: int):
+        bits = self._bits
+        cleared = getattr(bits, field) & ~(_GAMEPAD_BUTTON_MASK << self._shift)
+        setattr(bits, field, cleared | (value & _GAMEPAD_BUTTON_MASK) << self._shift)
+    
+    return property(get, set)
+
+
 class GamepadState:
     """Represents the state of a single gamepad"""
     
-    def __init__(self, id: int):
+    __slots__ = ('id', 'connected', '_bits', '_shift',
+                 'left_stick', 'right_stick', 'left_trigger', 'right_trigger', 'button_names')
+    
+    def __init__(self, id: int, bits: Optional[GamepadButtonBits] = None):
         self.id = id
         self.connected = False
         
-        # Button states (0-15 for standard gamepad)
-        self.buttons_pressed: Set[int] = set()
-        self.buttons_just_pressed: Set[int] = set()
-        self.buttons_just_released: Set[int] = set()
-        self.previous_buttons: Set[int] = set()
+        # Button state lives in a packed bitset shared with the other pads (or a private one)
+        if bits is None:
+            self._bits = GamepadButtonBits()
+            self._shift = 0
+        else:
+            self._bits = bits
+            self._shift = id * GAMEPAD_BUTTON_COUNT
         
         # Analog stick values (-1.0 to 1.0)
         self.left_stick = Vector2.zero()
@@ -27,41 +225,66 @@ class GamepadState:
         self.left_trigger = 0.0
         self.right_trigger = 0.0
         
-        # D-pad state
-        self.dpad_up = False
-        self.dpad_down = False
-        self.dpad_left = False
-        self.dpad_right = False
-        
-        # Standard button mapping
-        self.button_names = {
-            0: 'a', 1: 'b', 2: 'x', 3: 'y',
-            4: 'left_bumper', 5: 'right_bumper',
-            6: 'back', 7: 'start',
-            8: 'left_stick_button', 9: 'right_stick_button'
-        }
+        # Standard button mapping (the D-pad lives in buttons 12-15)
+        self.button_names = dict(GAMEPAD_BUTTON_NAMES)
+    
+    def _get_button_bit(self, button_id: int) -> bool:
+        return bool(self.buttons_pressed >> button_id & 1)
+    
+    def _set_button_bit(self, button_id: int, pressed: bool):
+        if pressed:
+            self.buttons_pressed |= 1 << button_id
+        else:
+            self.buttons_pressed &= ~(1 << button_id)
+    
+    # Button state bitsets (bit N is button N), views of this pad's packed slice
+    buttons_pressed = _button_slice('pressed')
+    buttons_just_pressed = _button_slice('just_pressed')
+    buttons_just_released = _button_slice('just_released')
+    previous_buttons = _button_slice('previous')
+    
+    # D-pad state, kept for compatibility; prefer is_gamepad_button_pressed("dpad_up")
+    dpad_up = property(lambda self: self._get_button_bit(12),
+                       lambda self, pressed: self._set_button_bit(12, pressed))
+    dpad_down = property(lambda self: self._get_button_bit(13),
+                         lambda self, pressed: self._set_button_bit(13, pressed))
+    dpad_left = property(lambda self: self._get_button_bit(14),
+                         lambda self, pressed: self._set_button_bit(14, pressed))
+    dpad_right = property(lambda self: self._get_button_bit(15),
+                          lambda self, pressed: self._set_button_bit(15, pressed))
 
 
 class InputProfile:
     """Input mapping profile for customizable controls"""
     
+    __slots__ = ('name', 'key_mappings', 'gamepad_mappings', 'mouse_mappings',
+                 '_resolved_cache', '_version')
+    
     def __init__(self, name: str):
         self.name = name
         self.key_mappings: Dict[str, str] = {}
         self.gamepad_mappings: Dict[str, str] = {}
         self.mouse_mappings: Dict[str, str] = {}
         
+        # action -> (key mask, gamepad button mask, mouse button mask), rebuilt lazily
+        self._resolved_cache: Dict[str, Tuple[int, int, int]] = {}
+        # Bumped on every mapping change so holders of resolved masks can revalidate
+        self._version = 0
+        
     def map_key(self, action: str, key: str):
         """Map an action to a keyboard key"""
         self.key_mappings[action] = key.lower()
+        self._invalidate()
         
     def map_gamepad_button(self, action: str, button: str):
         """Map an action to a gamepad button"""
         self.gamepad_mappings[action] = button.lower()
+        self._invalidate()
         
     def map_mouse_button(self, action: str, button: str):
         """Map an action to a mouse button"""
         self.mouse_mappings[action] = button.lower()
+        self._invalidate()
         
     def get_key_for_action(self, action: str) -> Optional[str]:
         """Get the key mapped to an action"""
@@ -74,303 +297,337 @@ class InputProfile:
     def get_mouse_button_for_action(self, action: str) -> Optional[str]:
         """Get the mouse button mapped to an action"""
         return self.mouse_mappings.get(action)
-
+    
+    def get_compiled_action(self, action: str) -> Tuple[int, int, int]:
+        """Get the (key, gamepad button, mouse button) bit masks bound to an action"""
+        compiled = self._resolved_cache.get(action)
+        if compiled is None:
+            compiled = self._compile_action(action)
+            self._resolved_cache[action] = compiled
+        return compiled
+    
+    def _invalidate(self):
+        """Drop resolved masks after a mapping change"""
+        self._resolved_cache.clear()
+        self._version += 1
+    
+    def _compile_action(self, action: str) -> Tuple[int, int, int]:
+        """Resolve an action's mappings to bit masks (0 for unmapped inputs)"""
+        key = self.key_mappings.get(action)
+        key_mask = 1 << _key_index(key) if key else 0
+        
+        button_mask = 0
+        button = self.gamepad_mappings.get(action)
+        if button:
+            button_id = _gamepad_button_id(button)
+            if button_id >= 0:
+                button_mask = 1 << button_id
+        
+        mouse_button = self.mouse_mappings.get(action)
+        mouse_mask = 1 << _MOUSE_BUTTON_CODES.get(mouse_button, 1) if mouse_button else 0
+        
+        return (key_mask, button_mask, mouse_mask)
+
+
+# Default profiles: id -> (display name, key, gamepad button and mouse mappings), all lowercase
+_DEFAULT_PROFILE_TEMPLATES: Dict[str, Tuple[str, Dict[str, str], Dict[str, str], Dict[str, str]]] = {
+    "default_keyboard": ("Default Keyboard", {
+        ACTION_MOVE_UP: "w", ACTION_MOVE_DOWN: "s", ACTION_MOVE_LEFT: "a", ACTION_MOVE_RIGHT: "d",
+        ACTION_ROTATE_LEFT: "q", ACTION_ROTATE_RIGHT: "e", ACTION_ACTION: "space", ACTION_PAUSE: "escape",
+    }, {}, {}),
+    "arrow_keys": ("Arrow Keys", {
+        ACTION_MOVE_UP: "up", ACTION_MOVE_DOWN: "down", ACTION_MOVE_LEFT: "left", ACTION_MOVE_RIGHT: "right",
+        ACTION_ROTATE_LEFT: "q", ACTION_ROTATE_RIGHT: "e", ACTION_ACTION: "space", ACTION_PAUSE: "escape",
+    }, {}, {}),
+    "default_gamepad": ("Default Gamepad", {}, {
+        ACTION_ACTION: "a", "back": "b", "special": "x", "menu": "y", ACTION_PAUSE: "start",
+    }, {}),
+}
+
+
+def _resolve_template(keys: Dict[str, str], buttons: Dict[str, str],
+                      mouse: Dict[str, str]) -> Dict[str, Tuple[int, int, int]]:
+    """Resolve every action in a profile template to its bit masks"""
+    profile = InputProfile("")
+    profile.key_mappings = keys
+    profile.gamepad_mappings = buttons
+    profile.mouse_mappings = mouse
+    for action in set(keys) | set(buttons) | set(mouse):
+        profile.get_compiled_action(action)
+    return profile._resolved_cache
+
+
+# Resolved masks for the default profiles, shared by every InputManager
+_DEFAULT_PROFILE_RESOLVED: Dict[str, Dict[str, Tuple[int, int, int]]] = {
+    profile_id: _resolve_template(keys, buttons, mouse)
+    for profile_id, (_, keys, buttons, mouse) in _DEFAULT_PROFILE_TEMPLATES.items()
+}
 
 class InputManager:
     """Handles all input from keyboard and mouse using tkinter events"""
 
+    __slots__ = ('keys_pressed', 'keys_just_pressed', 'keys_just_released', 'previous_keys',
+                 'mouse_position', 'mouse_buttons_pressed', 'mouse_buttons_just_pressed',
+                 'mouse_buttons_just_released', 'previous_mouse_buttons',
+                 'gamepads', 'gamepad_bits', '_connected_gamepads', 'profiles', 'active_profile',
+                 '_resolved_actions', '_resolved_profile', '_resolved_version',
+                 'key_map', 'frame_key_presses', 'frame_key_releases', 'frame_mouse_clicks',
+                 '_event_queue', 'input_callbacks')
+
     def __init__(self):
-        # Keyboard state
-        self.keys_pressed: Set[str] = set()
-        self.keys_just_pressed: Set[str] = set()
-        self.keys_just_released: Set[str] = set()
-        self.previous_keys: Set[str] = set()
+        # Keyboard state (bitsets indexed by KEY_INDEX)
+        self.keys_pressed = 0
+        self.keys_just_pressed = 0
+        self.keys_just_released = 0
+        self.previous_keys = 0
 
-        # Mouse state
+        # Mouse state (bitsets, bit N is mouse button N)
         self.mouse_position = Vector2.zero()
-        self.mouse_buttons_pressed: Set[int] = set()
-        self.mouse_buttons_just_pressed: Set[int] = set()
-        self.mouse_buttons_just_released: Set[int] = set()
-        self.previous_mouse_buttons: Set[int] = set()
-
-        # Gamepad state (support up to 4 controllers)
+        self.mouse_buttons_pressed = 0
+        self.mouse_buttons_just_pressed = 0
+        self.mouse_buttons_just_released = 0
+        self.previous_mouse_buttons = 0
+
+        # Gamepad state (support up to 4 controllers, buttons packed into one bitset).
+        # Pads are created when they first connect; keyboard-only games never build any.
+        self.gamepad_bits = GamepadButtonBits()
         self.gamepads: Dict[int, GamepadState] = {}
-        for i in range(4):
-            self.gamepads[i] = GamepadState(i)
+        self._connected_gamepads: List[GamepadState] = []
 
         # Input profiles
         self.profiles: Dict[str, InputProfile] = {}
         self.active_profile: Optional[InputProfile] = None
         self._create_default_profiles()
 
+        # Resolved action masks for the active profile, valid while its version matches
+        self._resolved_actions: Dict[str, Tuple[int, int, int]] = {}
+        self._resolved_profile: Optional[InputProfile] = None
+        self._resolved_version = -1
+
         # Key mapping for consistent key names
-        self.key_map = {
-            'Up': 'up',
-            'Down': 'down', 
-            'Left': 'left',
-            'Right': 'right',
-            'w': 'w',
-            'a': 'a',
-            's': 's',
-            'd': 'd',
-            'q': 'q',
-            'e': 'e',
-            'space': 'space',
-            'Escape': 'escape',
-            'F11': 'f11'
-        }
-
-        # Frame-specific input events
-        self.frame_key_presses: Set[str] = set()
-        self.frame_key_releases: Set[str] = set()
-        self.frame_mouse_clicks: Set[int] = set()
+        self.key_map = dict(_DEFAULT_KEY_MAP)
+
+        # Frame-specific input events (bitsets)
+        self.frame_key_presses = 0
+        self.frame_key_releases = 0
+        self.frame_mouse_clicks = 0
+
+        # Raw window events, queued by the callbacks and applied in one batch per frame
+        self._event_queue: Deque[Tuple[str, object, int, int]] = deque()
         
-        # Input event callbacks
-        self.input_callbacks: Dict[str, Callable] = {}
+        # Input event callbacks (event name -> subscribers, in registration order)
+        self.input_callbacks: Dict[str, List[Callable]] = {}
 
     def update(self):
         """Update input state - call this once per frame"""
-        # Store previous states
-        self.previous_keys = self.keys_pressed.copy()
-        self.previous_mouse_buttons = self.mouse_buttons_pressed.copy()
+        self.drain_events()
+        self.snapshot_frame_state()
 
+    def snapshot_frame_state(self):
+        """Compute this frame's just pressed/released state and reset frame events"""
         # Calculate just pressed/released from frame events
-        self.keys_just_pressed = self.frame_key_presses.copy()
-        self.keys_just_released = self.frame_key_releases.copy()
-        self.mouse_buttons_just_pressed = self.frame_mouse_clicks.copy()
+        self.keys_just_pressed = self.frame_key_presses
+        self.keys_just_released = self.frame_key_releases
+        self.mouse_buttons_just_pressed = self.frame_mouse_clicks
 
-        # Calculate just released mouse buttons
-        self.mouse_buttons_just_released = self.previous_mouse_buttons - self.mouse_buttons_pressed
+        # Calculate just released mouse buttons against last frame's state
+        self.mouse_buttons_just_released = self.previous_mouse_buttons & ~self.mouse_buttons_pressed
+
+        # Store previous states
+        self.previous_keys = self.keys_pressed
+        self.previous_mouse_buttons = self.mouse_buttons_pressed
 
-        # Update gamepad states
-        for gamepad in self.gamepads.values():
-            gamepad.previous_buttons = gamepad.buttons_pressed.copy()
-            # In a real implementation, you would poll the actual gamepad here
-            # For now, we'll simulate gamepad updates
-            self._update_gamepad_state(gamepad)
+        # Update all gamepad button states at once, skipped once no pad is connected
+        # and the last edges have settled
+        # In a real implementation, you would poll the actual gamepads before this
+        gamepad_bits = self.gamepad_bits
+        if self._connected_gamepads or gamepad_bits.previous or gamepad_bits.just_released:
+            gamepad_bits.update()
 
         # Clear frame-specific events
-        self.frame_key_presses.clear()
-        self.frame_key_releases.clear()
-        self.frame_mouse_clicks.clear()
+        self.frame_key_presses = 0
+        self.frame_key_releases = 0
+        self.frame_mouse_clicks = 0
+
+    def drain_events(self):
+        """Apply all queued window events to the input state"""
+        queue = self._event_queue
+        key_map = self.key_map
+
+        while queue:
+            event_type, code, x, y = queue.popleft()
+
+            if event_type == 'move':
+                # Mutate in place; get_mouse_position() hands out copies
+                mouse_position = self.mouse_position
+                mouse_position.x = x
+                mouse_position.y = y
+            elif event_type == 'key_press':
+                bit = 1 << _key_index(key_map.get(code) or _lower(code))
+                if not self.keys_pressed & bit:
+                    self.keys_pressed |= bit
+                    self.frame_key_presses |= bit
+            elif event_type == 'key_release':
+                bit = 1 << _key_index(key_map.get(code) or _lower(code))
+                if self.keys_pressed & bit:
+                    self.keys_pressed &= ~bit
+                    self.frame_key_releases |= bit
+            elif event_type == 'click':
+                bit = 1 << code
+                if not self.mouse_buttons_pressed & bit:
+                    self.mouse_buttons_pressed |= bit
+                    self.frame_mouse_clicks |= bit
+            elif event_type == 'release':
+                self.mouse_buttons_pressed &= ~(1 << code)
 
     def on_key_press(self, keysym: str, keycode: int):
-        """Handle key press events from window"""
-        key = self.key_map.get(keysym, keysym.lower())
-        if key not in self.keys_pressed:
-            self.keys_pressed.add(key)
-            self.frame_key_presses.add(key)
+        """Queue a key press event from window (applied on the next update)"""
+        self._event_queue.append(('key_press', keysym, 0, 0))
 
     def on_key_release(self, keysym: str, keycode: int):
-        """Handle key release events from window"""
-        key = self.key_map.get(keysym, keysym.lower())
-        if key in self.keys_pressed:
-            self.keys_pressed.remove(key)
-            self.frame_key_releases.add(key)
+        """Queue a key release event from window (applied on the next update)"""
+        self._event_queue.append(('key_release', keysym, 0, 0))
 
     def on_mouse_event(self, event_type: str, button: int, x: int, y: int):
-        """Handle mouse events from window"""
-        if event_type == 'move':
-            self.mouse_position = Vector2(x, y)
-        elif event_type == 'click':
-            if button not in self.mouse_buttons_pressed:
-                self.mouse_buttons_pressed.add(button)
-                self.frame_mouse_clicks.add(button)
-        elif event_type == 'release':
-            if button in self.mouse_buttons_pressed:
-                self.mouse_buttons_pressed.remove(button)
+        """Queue a mouse event from window (applied on the next update)"""
+        self._event_queue.append((event_type, button, x, y))
 
     # Keyboard methods
     def is_key_pressed(self, key: str) -> bool:
         """Check if a key is currently being held down"""
-        return key.lower() in self.keys_pressed
+        index = KEY_INDEX.get(_lower(key))
+        return index is not None and bool(self.keys_pressed >> index & 1)
 
     def is_key_just_pressed(self, key: str) -> bool:
         """Check if a key was just pressed this frame"""
-        return key.lower() in self.keys_just_pressed
+        index = KEY_INDEX.get(_lower(key))
+        return index is not None and bool(self.keys_just_pressed >> index & 1)
 
     def is_key_just_released(self, key: str) -> bool:
         """Check if a key was just released this frame"""
-        return key.lower() in self.keys_just_released
+        index = KEY_INDEX.get(_lower(key))
+        return index is not None and bool(self.keys_just_released >> index & 1)
 
     # Mouse methods
     def is_mouse_button_pressed(self, button) -> bool:
         """Check if a mouse button is currently being held down"""
         button_code = self._get_button_code(button)
-        return button_code in self.mouse_buttons_pressed
+        return button_code >= 0 and bool(self.mouse_buttons_pressed >> button_code & 1)
 
     def is_mouse_button_just_pressed(self, button) -> bool:
         """Check if a mouse button was just pressed this frame"""
         button_code = self._get_button_code(button)
-        return button_code in self.mouse_buttons_just_pressed
+        return button_code >= 0 and bool(self.mouse_buttons_just_pressed >> button_code & 1)
 
     def is_mouse_button_just_released(self, button) -> bool:
         """Check if a mouse button was just released this frame"""
         button_code = self._get_button_code(button)
-        return button_code in self.mouse_buttons_just_released
+        return button_code >= 0 and bool(self.mouse_buttons_just_released >> button_code & 1)
     
     def _get_button_code(self, button):
         """Convert button name to button code"""
+        code = _MOUSE_BUTTON_MAP.get(button)
+        if code is not None:
+            return code
         if isinstance(button, str):
-            button_map = {'left': 1, 'middle': 2, 'right': 3}
-            return button_map.get(button.lower(), 1)
+            return _MOUSE_BUTTON_CODES.get(_lower(button), 1)
         return button
 
     def get_mouse_position(self) -> Vector2:
         """Get current mouse position"""
         return self.mouse_position.copy()
 
+    def get_mouse_position_unsafe(self) -> Vector2:
+        """Get the live mouse position vector without copying (treat as read-only)"""
+        return self.mouse_position
+
     # Convenience methods for common keys
     def is_arrow_key_pressed(self) -> Tuple[bool, bool, bool, bool]:
         """Check arrow keys (up, down, left, right)"""
         return (
-            self.is_key_pressed('up'),
-            self.is_key_pressed('down'),
-            self.is_key_pressed('left'),
-            self.is_key_pressed('right')
+            self.is_key_pressed(KEY_UP),
+            self.is_key_pressed(KEY_DOWN),
+            self.is_key_pressed(KEY_LEFT),
+            self.is_key_pressed(KEY_RIGHT)
         )
 
     def is_wasd_pressed(self) -> Tuple[bool, bool, bool, bool]:
         """Check WASD keys (w, a, s, d)"""
         return (
-            self.is_key_pressed('w'),
-            self.is_key_pressed('a'),
-            self.is_key_pressed('s'),
-            self.is_key_pressed('d')
+            self.is_key_pressed(KEY_W),
+            self.is_key_pressed(KEY_A),
+            self.is_key_pressed(KEY_S),
+            self.is_key_pressed(KEY_D)
         )
 
     def get_movement_vector(self) -> Vector2:
         """Get normalized movement vector from arrow keys or WASD"""
-        movement = Vector2.zero()
-
-        # Check arrow keys
-        up, down, left, right = self.is_arrow_key_pressed()
-        if up:
-            movement.y -= 1
-        if down:
-            movement.y += 1
-        if left:
-            movement.x -= 1
-        if right:
-            movement.x += 1
-
-        # If no arrow keys, check WASD
-        if movement.magnitude == 0:
-            w, a, s, d = self.is_wasd_pressed()
-            if w:
-                movement.y -= 1
-            if s:
-                movement.y += 1
-            if a:
-                movement.x -= 1
-            if d:
-                movement.x += 1
-
-        # Normalize for diagonal movement
-        if movement.magnitude > 0:
-            movement = movement.normalize()
-
-        return movement
+        x, y = _movement_from_bits(self.keys_pressed)
+        return Vector2(x, y)
+    
+    def get_movement_xy(self) -> Tuple[float, float]:
+        """Get normalized movement (x, y) from arrow keys or WASD, without allocating a Vector2"""
+        return _movement_from_bits(self.keys_pressed)
     
     def _create_default_profiles(self):
-        """Create default input profiles"""
-        # Default keyboard profile
-        default_kb = InputProfile("Default Keyboard")
-        default_kb.map_key("move_up", "w")
-        default_kb.map_key("move_down", "s") 
-        default_kb.map_key("move_left", "a")
-        default_kb.map_key("move_right", "d")
-        default_kb.map_key("rotate_left", "q")
-        default_kb.map_key("rotate_right", "e")
-        default_kb.map_key("action", "space")
-        default_kb.map_key("pause", "escape")
-        self.profiles["default_keyboard"] = default_kb
-        
-        # Alternative keyboard profile (arrow keys)
-        arrow_kb = InputProfile("Arrow Keys")
-        arrow_kb.map_key("move_up", "up")
-        arrow_kb.map_key("move_down", "down")
-        arrow_kb.map_key("move_left", "left")
-        arrow_kb.map_key("move_right", "right")
-        arrow_kb.map_key("rotate_left", "q")
-        arrow_kb.map_key("rotate_right", "e")
-        arrow_kb.map_key("action", "space")
-        arrow_kb.map_key("pause", "escape")
-        self.profiles["arrow_keys"] = arrow_kb
-        
-        # Default gamepad profile
-        default_gp = InputProfile("Default Gamepad")
-        default_gp.map_gamepad_button("action", "a")
-        default_gp.map_gamepad_button("back", "b")
-        default_gp.map_gamepad_button("special", "x")
-        default_gp.map_gamepad_button("menu", "y")
-        default_gp.map_gamepad_button("pause", "start")
-        self.profiles["default_gamepad"] = default_gp
+        """Create default input profiles from the prebuilt templates"""
+        for profile_id, (name, keys, buttons, mouse) in _DEFAULT_PROFILE_TEMPLATES.items():
+            profile = InputProfile(name)
+            profile.key_mappings = keys.copy()
+            profile.gamepad_mappings = buttons.copy()
+            profile.mouse_mappings = mouse.copy()
+            profile._resolved_cache = _DEFAULT_PROFILE_RESOLVED[profile_id].copy()
+            self.profiles[profile_id] = profile
         
         # Set default active profile
-        self.active_profile = default_kb
-    
-    def _update_gamepad_state(self, gamepad: GamepadState):
-        """Update gamepad state (placeholder for actual gamepad polling)"""
-        # Calculate just pressed/released buttons
-        gamepad.buttons_just_pressed = gamepad.buttons_pressed - gamepad.previous_buttons
-        gamepad.buttons_just_released = gamepad.previous_buttons - gamepad.buttons_pressed
-        
-        # In a real implementation, you would use a library like pygame or pynput
-        # to get actual gamepad input. For now, this is a simulation framework.
+        self.active_profile = self.profiles["default_keyboard"]
     
     # Gamepad methods
     def is_gamepad_connected(self, gamepad_id: int = 0) -> bool:
         """Check if a gamepad is connected"""
-        return gamepad_id in self.gamepads and self.gamepads[gamepad_id].connected
+        gamepad = self.gamepads.get(gamepad_id)
+        return gamepad is not None and gamepad.connected
     
     def is_gamepad_button_pressed(self, button: str, gamepad_id: int = 0) -> bool:
         """Check if a gamepad button is currently pressed"""
         if not self.is_gamepad_connected(gamepad_id):
             return False
             
-        gamepad = self.gamepads[gamepad_id]
-        
-        # Handle named buttons
-        for btn_id, btn_name in gamepad.button_names.items():
-            if btn_name == button.lower():
-                return btn_id in gamepad.buttons_pressed
-        
-        # Handle numeric buttons
-        try:
-            button_id = int(button)
-            return button_id in gamepad.buttons_pressed
-        except ValueError:
-            return False
+        # Handle named and numeric buttons
+        button_id = _gamepad_button_id(_lower(button))
+        return button_id >= 0 and bool(
+            self.gamepad_bits.pressed >> (gamepad_id * GAMEPAD_BUTTON_COUNT + button_id) & 1)
     
     def is_gamepad_button_just_pressed(self, button: str, gamepad_id: int = 0) -> bool:
         """Check if a gamepad button was just pressed this frame"""
         if not self.is_gamepad_connected(gamepad_id):
             return False
             
-        gamepad = self.gamepads[gamepad_id]
-        
-        for btn_id, btn_name in gamepad.button_names.items():
-            if btn_name == button.lower():
-                return btn_id in gamepad.buttons_just_pressed
-        
-        try:
-            button_id = int(button)
-            return button_id in gamepad.buttons_just_pressed
-        except ValueError:
-            return False
+        button_id = _gamepad_button_id(_lower(button))
+        return button_id >= 0 and bool(
+            self.gamepad_bits.just_pressed >> (gamepad_id * GAMEPAD_BUTTON_COUNT + button_id) & 1)
+    
+    def is_any_gamepad_button_pressed(self, button: str) -> bool:
+        """Check if a button is currently pressed on any gamepad"""
+        button_id = _gamepad_button_id(_lower(button))
+        return button_id >= 0 and bool(self.gamepad_bits.pressed & _ALL_GAMEPADS_BIT0 << button_id)
     
     def get_gamepad_stick(self, stick: str, gamepad_id: int = 0) -> Vector2:
         """Get gamepad analog stick value"""
+        return self.get_gamepad_stick_unsafe(stick, gamepad_id).copy()
+    
+    def get_gamepad_stick_unsafe(self, stick: str, gamepad_id: int = 0) -> Vector2:
+        """Get the live gamepad stick vector without copying (treat as read-only)"""
         if not self.is_gamepad_connected(gamepad_id):
-            return Vector2.zero()
+            return _ZERO_STICK
             
         gamepad = self.gamepads[gamepad_id]
-        if stick.lower() == "left":
-            return gamepad.left_stick.copy()
-        elif stick.lower() == "right":
-            return gamepad.right_stick.copy()
-        return Vector2.zero()
+        stick = _lower(stick)
+        if stick == "left":
+            return gamepad.left_stick
+        elif stick == "right":
+            return gamepad.right_stick
+        return _ZERO_STICK
     
     def get_gamepad_trigger(self, trigger: str, gamepad_id: int = 0) -> float:
         """Get gamepad trigger value (0.0 to 1.0)"""
@@ -378,9 +635,10 @@ class InputManager:
             return 0.0
             
         gamepad = self.gamepads[gamepad_id]
-        if trigger.lower() == "left":
+        trigger = _lower(trigger)
+        if trigger == "left":
             return gamepad.left_trigger
-        elif trigger.lower() == "right":
+        elif trigger == "right":
             return gamepad.right_trigger
         return 0.0
     
@@ -409,114 +667,130 @@ class InputManager:
         return list(self.profiles.keys())
     
     # Action-based input methods (using active profile)
+    def _resolved(self, action: str) -> Tuple[int, int, int]:
+        """Get the active profile's (key, gamepad button, mouse button) masks for an action"""
+        profile = self.active_profile
+        if profile is None:
+            return (0, 0, 0)
+        
+        if profile is not self._resolved_profile or profile._version != self._resolved_version:
+            self._resolved_actions.clear()
+            self._resolved_profile = profile
+            self._resolved_version = profile._version
+        
+        masks = self._resolved_actions.get(action)
+        if masks is None:
+            masks = profile.get_compiled_action(action)
+            self._resolved_actions[action] = masks
+        return masks
+    
+    def _test_action(self, action: str, key_bits: int, button_bits: int, mouse_bits: int) -> bool:
+        """Check an action's resolved masks against the given key, gamepad and mouse bitsets"""
+        key_mask, button_mask, mouse_mask = self._resolved(action)
+        return bool((key_bits & key_mask) | (button_bits & button_mask) | (mouse_bits & mouse_mask))
+    
     def is_action_pressed(self, action: str) -> bool:
         """Check if an action is pressed using the active profile"""
-        if not self.active_profile:
-            return False
-            
-        # Check keyboard mapping
-        key = self.active_profile.get_key_for_action(action)
-        if key and self.is_key_pressed(key):
-            return True
-            
-        # Check gamepad mapping
-        button = self.active_profile.get_gamepad_button_for_action(action)
-        if button and self.is_gamepad_button_pressed(button):
-            return True
-            
-        # Check mouse mapping
-        mouse_btn = self.active_profile.get_mouse_button_for_action(action)
-        if mouse_btn and self.is_mouse_button_pressed(mouse_btn):
-            return True
-            
-        return False
+        # Action button masks fit in 16 bits, so against the packed bits they only see pad 0
+        return self._test_action(action, self.keys_pressed,
+                                 self.gamepad_bits.pressed, self.mouse_buttons_pressed)
     
     def is_action_just_pressed(self, action: str) -> bool:
         """Check if an action was just pressed using the active profile"""
-        if not self.active_profile:
-            return False
-            
-        # Check keyboard mapping
-        key = self.active_profile.get_key_for_action(action)
-        if key and self.is_key_just_pressed(key):
-            return True
-            
-        # Check gamepad mapping
-        button = self.active_profile.get_gamepad_button_for_action(action)
-        if button and self.is_gamepad_button_just_pressed(button):
-            return True
-            
-        # Check mouse mapping
-        mouse_btn = self.active_profile.get_mouse_button_for_action(action)
-        if mouse_btn and self.is_mouse_button_just_pressed(mouse_btn):
-            return True
-            
-        return False
+        return self._test_action(action, self.keys_just_pressed,
+                                 self.gamepad_bits.just_pressed, self.mouse_buttons_just_pressed)
     
     def get_action_movement_vector(self) -> Vector2:
         """Get movement vector from action mappings"""
         if not self.active_profile:
             return self.get_movement_vector()  # Fallback to default
             
-        movement = Vector2.zero()
+        x = 0.0
+        y = 0.0
         
-        if self.is_action_pressed("move_up"):
-            movement.y -= 1
-        if self.is_action_pressed("move_down"):
-            movement.y += 1
-        if self.is_action_pressed("move_left"):
-            movement.x -= 1
-        if self.is_action_pressed("move_right"):
-            movement.x += 1
+        if self.is_action_pressed(ACTION_MOVE_UP):
+            y -= 1
+        if self.is_action_pressed(ACTION_MOVE_DOWN):
+            y += 1
+        if self.is_action_pressed(ACTION_MOVE_LEFT):
+            x -= 1
+        if self.is_action_pressed(ACTION_MOVE_RIGHT):
+            x += 1
             
         # Also check gamepad left stick
-        stick_input = self.get_gamepad_stick("left")
-        if stick_input.magnitude > 0.1:  # Dead zone
-            movement += stick_input
+        stick_input = self.get_gamepad_stick_unsafe("left")
+        sx = stick_input.x
+        sy = stick_input.y
+        if sx * sx + sy * sy > 0.01:  # Dead zone of 0.1, compared squared
+            x += sx
+            y += sy
             
         # Normalize for diagonal movement
-        if movement.magnitude > 1:
-            movement = movement.normalize()
+        length_sq = x * x + y * y
+        if length_sq > 1:
+            inv = 1.0 / math.sqrt(length_sq)
+            return Vector2(x * inv, y * inv)
             
-        return movement
+        return Vector2(x, y)
     
     # Event callback system
     def register_input_callback(self, event_name: str, callback: Callable):
         """Register a callback for input events"""
-        self.input_callbacks[event_name] = callback
+        callbacks = self.input_callbacks.get(event_name)
+        if callbacks is None:
+            callbacks = self.input_callbacks[event_name] = []
+        callbacks.append(callback)
     
-    def unregister_input_callback(self, event_name: str):
-        """Unregister an input callback"""
-        if event_name in self.input_callbacks:
+    def unregister_input_callback(self, event_name: str, callback: Optional[Callable] = None):
+        """Unregister one callback for an event, or all of them if none is given"""
+        callbacks = self.input_callbacks.get(event_name)
+        if callbacks is None:
+            return
+        if callback is None:
+            callbacks.clear()
+        elif callback in callbacks:
+            callbacks.remove(callback)
+        if not callbacks:
             del self.input_callbacks[event_name]
     
     def trigger_callback(self, event_name: str, *args, **kwargs):
-        """Trigger a registered callback"""
-        if event_name in self.input_callbacks:
-            self.input_callbacks[event_name](*args, **kwargs)
+        """Trigger every callback registered for an event"""
+        callbacks = self.input_callbacks.get(event_name)
+        if callbacks:
+            for callback in callbacks:
+                callback(*args, **kwargs)
     
     # Simulation methods for testing gamepad functionality
     def simulate_gamepad_connection(self, gamepad_id: int = 0):
         """Simulate connecting a gamepad (for testing)"""
-        if gamepad_id in self.gamepads:
-            self.gamepads[gamepad_id].connected = True
+        if not 0 <= gamepad_id < MAX_GAMEPADS:
+            return
+        
+        gamepad = self.gamepads.get(gamepad_id)
+        if gamepad is None:
+            gamepad = self.gamepads[gamepad_id] = GamepadState(gamepad_id, self.gamepad_bits)
+        if not gamepad.connected:
+            gamepad.connected = True
+            self._connected_gamepads.append(gamepad)
+    
+    def simulate_gamepad_disconnection(self, gamepad_id: int = 0):
+        """Simulate disconnecting a gamepad (for testing); its held buttons are released"""
+        gamepad = self.gamepads.get(gamepad_id)
+        if gamepad is None or not gamepad.connected:
+            return
+        
+        gamepad.connected = False
+        gamepad.buttons_pressed = 0
+        self._connected_gamepads.remove(gamepad)
     
     def simulate_gamepad_button_press(self, button: str, gamepad_id: int = 0):
         """Simulate pressing a gamepad button (for testing)"""
         if not self.is_gamepad_connected(gamepad_id):
             return
             
-        gamepad = self.gamepads[gamepad_id]
-        for btn_id, btn_name in gamepad.button_names.items():
-            if btn_name == button.lower():
-                gamepad.buttons_pressed.add(btn_id)
-                return
-                
-        try:
-            button_id = int(button)
-            gamepad.buttons_pressed.add(button_id)
-        except ValueError:
-            pass
+        button_id = _gamepad_button_id(_lower(button))
+        if button_id >= 0:
+            self.gamepad_bits.pressed |= 1 << (gamepad_id * GAMEPAD_BUTTON_COUNT + button_id)
     
     def simulate_gamepad_stick_input(self, stick: str, x: float, y: float, gamepad_id: int = 0):
         """Simulate gamepad stick input (for testing)"""
@@ -526,7 +800,8 @@ class InputManager:
         gamepad = self.gamepads[gamepad_id]
         stick_vector = Vector2(max(-1.0, min(1.0, x)), max(-1.0, min(1.0, y)))
         
-        if stick.lower() == "left":
+        stick = _lower(stick)
+        if stick == "left":
             gamepad.left_stick = stick_vector
-        elif stick.lower() == "right":
+        elif stick == "right":
             gamepad.right_stick = stick_vector
\ No newline at end of file
@@ -3,13 +3,16 @@
 Quaternion implementation for 3D rotations
 """
 import math
-from typing import Tuple
+from array import array
+from typing import Tuple, List, Sequence
 from .vector3 import Vector3
 
 
 class Quaternion:
     """Quaternion class for representing 3D rotations"""
     
+    __slots__ = ('x', 'y', 'z', 'w')
+    
     def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0, w: float = 1.0):
         self.x = float(x)
         self.y = float(y)
@@ -44,11 +47,45 @@ class Quaternion:
     def __rmul__(self, scalar: float) -> 'Quaternion':
         return self.__mul__(scalar)
     
+    # In-place operators mutate this quaternion, so every holder of a shared reference sees the change
+    def __iadd__(self, other: 'Quaternion') -> 'Quaternion':
+        self.x += other.x
+        self.y += other.y
+        self.z += other.z
+        self.w += other.w
+        return self
+    
+    def __isub__(self, other: 'Quaternion') -> 'Quaternion':
+        self.x -= other.x
+        self.y -= other.y
+        self.z -= other.z
+        self.w -= other.w
+        return self
+    
+    def __imul__(self, other) -> 'Quaternion':
+        if isinstance(other, Quaternion):
+            x, y, z, w = self.x, self.y, self.z, self.w
+            self.x = w * other.x + x * other.w + y * other.z - z * other.y
+            self.y = w * other.y - x * other.z + y * other.w + z * other.x
+            self.z = w * other.z + x * other.y - y * other.x + z * other.w
+            self.w = w * other.w - x * other.x - y * other.y - z * other.z
+        else:
+            self.x *= other
+            self.y *= other
+            self.z *= other
+            self.w *= other
+        return self
+    
     def __eq__(self, other: 'Quaternion') -> bool:
-        return (abs(self.x - other.x) < 1e-6 and 
-                abs(self.y - other.y) < 1e-6 and 
-                abs(self.z - other.z) < 1e-6 and 
-                abs(self.w - other.w) < 1e-6)
+        # Within 1e-6 of each other, compared squared to avoid per-component abs()
+        dx = self.x - other.x
+        dy = self.y - other.y
+        dz = self.z - other.z
+        dw = self.w - other.w
+        return dx * dx + dy * dy + dz * dz + dw * dw < 1e-12
+    
+    # Mutable, so not hashable
+    __hash__ = None
     
     def copy(self) -> 'Quaternion':
         """Create a copy of this quaternion"""
@@ -66,26 +103,37 @@ class Quaternion:
     
     def normalize(self) -> 'Quaternion':
         """Return a normalized version of this quaternion"""
-        mag = self.magnitude
-        if mag == 0:
+        mag_sq = self.x * self.x + self.y * self.y + self.z * self.z + self.w * self.w
+        if mag_sq == 0:
             return Quaternion.identity()
-        return Quaternion(self.x / mag, self.y / mag, self.z / mag, self.w / mag)
+        inv = 1.0 / math.sqrt(mag_sq)
+        return Quaternion(self.x * inv, self.y * inv, self.z * inv, self.w * inv)
     
     def normalized(self) -> 'Quaternion':
         """Alias for normalize()"""
         return self.normalize()
     
+    def normalize_if_needed(self, eps: float = 1e-6) -> 'Quaternion':
+        """Return this quaternion if it is already unit length (within eps), otherwise a normalized copy"""
+        mag_sq = self.x * self.x + self.y * self.y + self.z * self.z + self.w * self.w
+        if abs(mag_sq - 1.0) < eps:
+            return self
+        if mag_sq == 0:
+            return Quaternion.identity()
+        inv = 1.0 / math.sqrt(mag_sq)
+        return Quaternion(self.x * inv, self.y * inv, self.z * inv, self.w * inv)
+    
     def conjugate(self) -> 'Quaternion':
         """Return the conjugate of this quaternion"""
         return Quaternion(-self.x, -self.y, -self.z, self.w)
     
     def inverse(self) -> 'Quaternion':
         """Return the inverse of this quaternion"""
-        mag_sq = self.magnitude_squared
+        mag_sq = self.x * self.x + self.y * self.y + self.z * self.z + self.w * self.w
         if mag_sq == 0:
             return Quaternion.identity()
-        conj = self.conjugate()
-        return Quaternion(conj.x / mag_sq, conj.y / mag_sq, conj.z / mag_sq, conj.w / mag_sq)
+        inv = 1.0 / mag_sq
+        return Quaternion(-self.x * inv, -self.y * inv, -self.z * inv, self.w * inv)
     
     def dot(self, other: 'Quaternion') -> float:
         """Calculate dot product with another quaternion"""
@@ -93,13 +141,44 @@ class Quaternion:
     
     def rotate_vector(self, vector: Vector3) -> Vector3:
         """Rotate a vector by this quaternion"""
-        # Convert vector to quaternion
-        vec_quat = Quaternion(vector.x, vector.y, vector.z, 0)
+        # Expanded q * v * q^-1: v + 2 * (w * (u x v) + u x (u x v)) / |q|^2 with u = (x, y, z),
+        # so no intermediate quaternions are built
+        qx, qy, qz, qw = self.x, self.y, self.z, self.w
+        mag_sq = qx * qx + qy * qy + qz * qz + qw * qw
+        if mag_sq == 0:
+            return Vector3(0, 0, 0)
+        k = 2.0 / mag_sq
+        
+        vx, vy, vz = vector.x, vector.y, vector.z
+        uv_x = qy * vz - qz * vy
+        uv_y = qz * vx - qx * vz
+        uv_z = qx * vy - qy * vx
+        uuv_x = qy * uv_z - qz * uv_y
+        uuv_y = qz * uv_x - qx * uv_z
+        uuv_z = qx * uv_y - qy * uv_x
+        
+        return Vector3(vx + k * (qw * uv_x + uuv_x),
+                       vy + k * (qw * uv_y + uuv_y),
+                       vz + k * (qw * uv_z + uuv_z))
+    
+    def to_rotation_matrix(self) -> List[float]:
+        """Convert quaternion to a 3x3 rotation matrix as a 9-element row-major list"""
+        # Homogeneous form, scaled by 2/|q|^2 so non-unit quaternions rotate like rotate_vector
+        x, y, z, w = self.x, self.y, self.z, self.w
+        mag_sq = x * x + y * y + z * z + w * w
+        if mag_sq == 0:
+            return [1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0]
+        s = 2.0 / mag_sq
         
-        # Apply rotation: q * v * q^-1
-        result = self * vec_quat * self.inverse()
+        xx, yy, zz = x * x * s, y * y * s, z * z * s
+        xy, xz, yz = x * y * s, x * z * s, y * z * s
+        wx, wy, wz = w * x * s, w * y * s, w * z * s
         
-        return Vector3(result.x, result.y, result.z)
+        return [
+            1.0 - (yy + zz), xy - wz, xz + wy,
+            xy + wz, 1.0 - (xx + zz), yz - wx,
+            xz - wy, yz + wx, 1.0 - (xx + yy)
+        ]
     
     def to_euler_angles(self) -> Tuple[float, float, float]:
         """Convert quaternion to Euler angles (roll, pitch, yaw) in radians"""
@@ -134,42 +213,38 @@ class Quaternion:
             # If s is close to zero, direction of axis not important
             axis = Vector3(self.x, self.y, self.z)
         else:
-            axis = Vector3(self.x / s, self.y / s, self.z / s)
+            inv_s = 1.0 / s
+            axis = Vector3(self.x * inv_s, self.y * inv_s, self.z * inv_s)
         
         return (axis, angle)
     
     def lerp(self, other: 'Quaternion', t: float) -> 'Quaternion':
         """Linear interpolation between quaternions (not recommended for rotation)"""
         t = max(0, min(1, t))
-        return (self * (1 - t) + other * t).normalized()
+        inv_t = 1 - t
+        return Quaternion(self.x * inv_t + other.x * t,
+                          self.y * inv_t + other.y * t,
+                          self.z * inv_t + other.z * t,
+                          self.w * inv_t + other.w * t).normalize_if_needed()
     
     def slerp(self, other: 'Quaternion', t: float) -> 'Quaternion':
         """Spherical linear interpolation between quaternions"""
         t = max(0, min(1, t))
         
-        dot = self.dot(other)
+        ox, oy, oz, ow = other.x, other.y, other.z, other.w
+        dot = self.x * ox + self.y * oy + self.z * oz + self.w * ow
         
         # If the dot product is negative, the quaternions represent the same rotation
-        # but are on opposite sides of the 4D sphere, so we negate one
-        if dot < 0:
-            other = other * -1
-            dot = -dot
+        # but are on opposite sides of the 4D sphere, so we negate one by folding
+        # the sign into its weight
+        s0, s1 = _slerp_weights(abs(dot), t)
+        s1 = math.copysign(s1, dot)
+        x = self.x * s0 + ox * s1
+        y = self.y * s0 + oy * s1
+        z = self.z * s0 + oz * s1
+        w = self.w * s0 + ow * s1
         
-        # If the quaternions are very similar, use linear interpolation
-        if dot > 0.9995:
-            return self.lerp(other, t)
-        
-        # Calculate angle between quaternions
-        theta_0 = math.acos(abs(dot))
-        sin_theta_0 = math.sin(theta_0)
-        
-        theta = theta_0 * t
-        sin_theta = math.sin(theta)
-        
-        s0 = math.cos(theta) - dot * sin_theta / sin_theta_0
-        s1 = sin_theta / sin_theta_0
-        
-        return (self * s0 + other * s1).normalized()
+        return Quaternion(x, y, z, w).normalize_if_needed()
     
     @staticmethod
     def identity() -> 'Quaternion':
@@ -179,18 +254,27 @@ class Quaternion:
     @staticmethod
     def from_euler_angles(roll: float, pitch: float, yaw: float) -> 'Quaternion':
         """Create quaternion from Euler angles (in radians)"""
-        cr = math.cos(roll * 0.5)
-        sr = math.sin(roll * 0.5)
-        cp = math.cos(pitch * 0.5)
-        sp = math.sin(pitch * 0.5)
-        cy = math.cos(yaw * 0.5)
-        sy = math.sin(yaw * 0.5)
+        half_roll = roll * 0.5
+        half_pitch = pitch * 0.5
+        half_yaw = yaw * 0.5
+        cr = math.cos(half_roll)
+        sr = math.sin(half_roll)
+        cp = math.cos(half_pitch)
+        sp = math.sin(half_pitch)
+        cy = math.cos(half_yaw)
+        sy = math.sin(half_yaw)
+        
+        # Each roll/pitch product appears in two components
+        cr_cp = cr * cp
+        sr_sp = sr * sp
+        cr_sp = cr * sp
+        sr_cp = sr * cp
         
         return Quaternion(
-            sr * cp * cy - cr * sp * sy,
-            cr * sp * cy + sr * cp * sy,
-            cr * cp * sy - sr * sp * cy,
-            cr * cp * cy + sr * sp * sy
+            sr_cp * cy - cr_sp * sy,
+            cr_sp * cy + sr_cp * sy,
+            cr_cp * sy - sr_sp * cy,
+            cr_cp * cy + sr_sp * sy
         )
     
     @staticmethod
@@ -244,7 +328,7 @@ class Quaternion:
     def look_rotation(forward: Vector3, up: Vector3 = None) -> 'Quaternion':
         """Create quaternion that rotates forward to look in the given direction"""
         if up is None:
-            up = Vector3.up()
+            up = Vector3.UP
         
         forward = forward.normalized()
         up = up.normalized()
@@ -260,3 +344,93 @@ class Quaternion:
         ]
         
         return Quaternion.from_rotation_matrix(matrix)
+
+
+
+# Shared read-only identity; Quaternion.identity() still returns a fresh copy
+Quaternion.IDENTITY = Quaternion(0, 0, 0, 1)
+
+def _slerp_weights(dot: float, t: float) -> Tuple[float, float]:
+    """Blend weights (s0, s1) for slerp, given a non-negative dot product and t in [0, 1]"""
+    # If the quaternions are very similar, use linear interpolation
+    if dot > 0.9995:
+        return 1.0 - t, t
+    
+    # sin(acos(dot)) is sqrt(1 - dot^2), which saves one trig call
+    theta_0 = math.acos(dot)
+    inv_sin_theta_0 = 1.0 / math.sqrt(1.0 - dot * dot)
+    theta = theta_0 * t
+    sin_theta = math.sin(theta)
+    
+    return math.cos(theta) - dot * sin_theta * inv_sin_theta_0, sin_theta * inv_sin_theta_0
+
+
+def pack_quaternions(quaternions: Sequence[Quaternion]) -> array:
+    """Pack quaternions into a flat array of [x, y, z, w] components for the batch functions"""
+    data = array('d')
+    for q in quaternions:
+        data.append(q.x)
+        data.append(q.y)
+        data.append(q.z)
+        data.append(q.w)
+    return data
+
+
+def unpack_quaternions(data: array) -> List[Quaternion]:
+    """Build Quaternion objects back from a flat [x, y, z, w] component array"""
+    return [Quaternion(data[i], data[i + 1], data[i + 2], data[i + 3]) for i in range(0, len(data), 4)]
+
+
+def rotate_vectors_batch(q: Quaternion, vectors: array) -> array:
+    """Rotate a flat array of [x, y, z] components by q, returning a new array"""
+    out = array('d', bytes(8 * len(vectors)))
+    if q.x * q.x + q.y * q.y + q.z * q.z + q.w * q.w == 0:
+        return out
+    
+    # Convert once to a rotation matrix: 9 multiplies per vector instead of the cross products
+    m00, m01, m02, m10, m11, m12, m20, m21, m22 = q.to_rotation_matrix()
+    for i in range(0, len(vectors), 3):
+        vx, vy, vz = vectors[i], vectors[i + 1], vectors[i + 2]
+        out[i] = m00 * vx + m01 * vy + m02 * vz
+        out[i + 1] = m10 * vx + m11 * vy + m12 * vz
+        out[i + 2] = m20 * vx + m21 * vy + m22 * vz
+    
+    return out
+
+
+def slerp_batch(a: array, b: array, t: Sequence[float]) -> array:
+    """Slerp packed quaternion arrays a and b element-wise by the factors in t"""
+    out = array('d', bytes(8 * len(a)))
+    
+    for n in range(len(a) // 4):
+        i = n * 4
+        ax, ay, az, aw = a[i], a[i + 1], a[i + 2], a[i + 3]
+        bx, by, bz, bw = b[i], b[i + 1], b[i + 2], b[i + 3]
+        tn = t[n]
+        tn = 0.0 if tn < 0.0 else 1.0 if tn > 1.0 else tn
+        
+        # Take the short way around the 4D sphere
+        dot = ax * bx + ay * by + az * bz + aw * bw
+        s0, s1 = _slerp_weights(abs(dot), tn)
+        s1 = math.copysign(s1, dot)
+        
+        x = ax * s0 + bx * s1
+        y = ay * s0 + by * s1
+        z = az * s0 + bz * s1
+        w = aw * s0 + bw * s1
+        
+        # Only renormalize results that drifted off the unit sphere (see normalize_if_needed)
+        mag_sq = x * x + y * y + z * z + w * w
+        if abs(mag_sq - 1.0) < 1e-6:
+            inv = 1.0
+        elif mag_sq == 0:
+            out[i + 3] = 1.0
+            continue
+        else:
+            inv = 1.0 / math.sqrt(mag_sq)
+        out[i] = x * inv
+        out[i + 1] = y * inv
+        out[i + 2] = z * inv
+        out[i + 3] = w * inv
+    
+    return out
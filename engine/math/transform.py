@@ -1,6 +1,8 @@
 """
 Transform component for position, rotation, and scale
 """
+from array import array
+from typing import Tuple, Dict
 from .vector2 import Vector2
 import math
 
@@ -8,16 +10,26 @@ import math
 class Transform:
     """Transform component handling position, rotation, and scale"""
     
+    __slots__ = ('position', 'rotation', 'scale', '_parent', '_children',
+                 '_quaternion_rotation', '_use_3d',
+                 '_version', '_cache_local', '_cache_parent_ver', '_cached_world')
+    
     def __init__(self, position: Vector2 = None, rotation: float = 0.0, scale: Vector2 = None):
         self.position = position or Vector2.zero()
         self.rotation = rotation  # In radians
         self.scale = scale or Vector2.one()
         self._parent = None
-        self._children = []
+        self._children: Dict[int, 'Transform'] = {}  # id(child) -> child, in attach order
         
         # 3D support (optional)
         self._quaternion_rotation = None
         self._use_3d = False
+        
+        # Cached world state, see _world()
+        self._version = 0
+        self._cache_local = None
+        self._cache_parent_ver = -1
+        self._cached_world = None
     
     def __str__(self) -> str:
         return f"Transform(pos={self.position}, rot={math.degrees(self.rotation):.1f}°, scale={self.scale})"
@@ -31,53 +43,100 @@ class Transform:
     def parent(self, parent_transform):
         """Set parent transform"""
         if self._parent:
-            self._parent._children.remove(self)
+            del self._parent._children[id(self)]
         
         self._parent = parent_transform
+        self._cache_parent_ver = -1
         if parent_transform:
-            parent_transform._children.append(self)
+            parent_transform._children[id(self)] = self
     
     @property
     def children(self):
         """Get list of child transforms"""
-        return list(self._children)  # Return copy to prevent external modification
+        return list(self._children.values())  # Return copy to prevent external modification
+    
+    def _world(self) -> Tuple[float, float, float, float, float, float, float, float, float]:
+        """Get world (x, y, rotation, scale x, scale y, cos rotation, sin rotation,
+        1/scale x, 1/scale y), recomputed only when this transform or a parent changed"""
+        # Local values are compared rather than tracked through setters, since game code
+        # commonly edits position/scale components in place
+        position = self.position
+        scale = self.scale
+        local = (position.x, position.y, self.rotation, scale.x, scale.y)
+        
+        parent = self._parent
+        if parent is None:
+            if local != self._cache_local:
+                rotation = local[2]
+                scale_x = local[3]
+                scale_y = local[4]
+                self._cache_local = local
+                self._cached_world = local + (math.cos(rotation), math.sin(rotation),
+                                              1.0 / scale_x if scale_x else 0.0,
+                                              1.0 / scale_y if scale_y else 0.0)
+                self._version += 1
+            return self._cached_world
+        
+        parent_world = parent._world()
+        if local == self._cache_local and parent._version == self._cache_parent_ver:
+            return self._cached_world
+        
+        # Scale and rotate local position by the parent, then add parent position
+        parent_x, parent_y, parent_rotation, parent_scale_x, parent_scale_y, cos_r, sin_r, _, _ = parent_world
+        scaled_x = local[0] * parent_scale_x
+        scaled_y = local[1] * parent_scale_y
+        rotation = parent_rotation + local[2]
+        scale_x = local[3] * parent_scale_x
+        scale_y = local[4] * parent_scale_y
+        self._cached_world = (
+            parent_x + (scaled_x * cos_r - scaled_y * sin_r),
+            parent_y + (scaled_x * sin_r + scaled_y * cos_r),
+            rotation,
+            scale_x,
+            scale_y,
+            math.cos(rotation),
+            math.sin(rotation),
+            1.0 / scale_x if scale_x else 0.0,
+            1.0 / scale_y if scale_y else 0.0
+        )
+        self._cache_local = local
+        self._cache_parent_ver = parent._version
+        self._version += 1
+        return self._cached_world
     
     @property
     def world_position(self) -> Vector2:
         """Get world position (considering parent transforms)"""
         if not self._parent:
             return self.position.copy()
-        
-        # Apply parent's transform
-        parent_world = self._parent.world_position
-        parent_rotation = self._parent.world_rotation
-        parent_scale = self._parent.world_scale
-        
-        # Scale and rotate local position, then add parent position
-        scaled_pos = Vector2(self.position.x * parent_scale.x, self.position.y * parent_scale.y)
-        rotated_pos = scaled_pos.rotate(parent_rotation)
-        return parent_world + rotated_pos
+        world = self._world()
+        return Vector2(world[0], world[1])
     
     @property
     def world_rotation(self) -> float:
         """Get world rotation (considering parent transforms)"""
         if not self._parent:
             return self.rotation
-        return self._parent.world_rotation + self.rotation
+        return self._world()[2]
     
     @property
     def world_scale(self) -> Vector2:
         """Get world scale (considering parent transforms)"""
         if not self._parent:
             return self.scale.copy()
-        
-        parent_scale = self._parent.world_scale
-        return Vector2(self.scale.x * parent_scale.x, self.scale.y * parent_scale.y)
+        world = self._world()
+        return Vector2(world[3], world[4])
     
     def translate(self, delta: Vector2):
         """Move by delta vector"""
         self.position += delta
     
+    def translate_xy(self, dx: float, dy: float):
+        """Move by (dx, dy) in place, without allocating a delta vector"""
+        position = self.position
+        position.x += dx
+        position.y += dy
+    
     def rotate(self, delta_rotation: float):
         """Rotate by delta angle in radians"""
         self.rotation += delta_rotation
@@ -93,33 +152,74 @@ class Transform:
     
     def forward(self) -> Vector2:
         """Get forward direction vector"""
-        return Vector2.from_angle(self.world_rotation)
+        world = self._world()
+        return Vector2(world[5], world[6])
     
     def right(self) -> Vector2:
-        """Get right direction vector"""
-        return Vector2.from_angle(self.world_rotation + math.pi / 2)
+        """Get right direction vector (forward turned by 90 degrees)"""
+        world = self._world()
+        return Vector2(-world[6], world[5])
     
     def transform_point(self, local_point: Vector2) -> Vector2:
         """Transform a local point to world space"""
-        world_scale = self.world_scale
-        world_rotation = self.world_rotation
-        world_position = self.world_position
+        world_x, world_y, _, world_scale_x, world_scale_y, cos_r, sin_r, _, _ = self._world()
         
-        # Scale, then rotate, then translate
-        scaled = Vector2(local_point.x * world_scale.x, local_point.y * world_scale.y)
-        rotated = scaled.rotate(world_rotation)
-        return world_position + rotated
+        # Scale, then rotate (with the cached sin/cos), then translate
+        scaled_x = local_point.x * world_scale_x
+        scaled_y = local_point.y * world_scale_y
+        return Vector2(world_x + (scaled_x * cos_r - scaled_y * sin_r),
+                       world_y + (scaled_x * sin_r + scaled_y * cos_r))
+    
+    def transform_points(self, points: array) -> array:
+        """Transform a flat array of local [x, y] components to world space, returning a new array"""
+        world_x, world_y, _, world_scale_x, world_scale_y, cos_r, sin_r, _, _ = self._world()
+        
+        # Fold scale into the 2x2 rotation so each point is two multiply-adds per axis
+        m00 = cos_r * world_scale_x
+        m01 = -sin_r * world_scale_y
+        m10 = sin_r * world_scale_x
+        m11 = cos_r * world_scale_y
+        
+        out = array('d', bytes(8 * len(points)))
+        for i in range(0, len(points), 2):
+            x = points[i]
+            y = points[i + 1]
+            out[i] = world_x + (m00 * x + m01 * y)
+            out[i + 1] = world_y + (m10 * x + m11 * y)
+        return out
     
     def inverse_transform_point(self, world_point: Vector2) -> Vector2:
         """Transform a world point to local space"""
-        world_scale = self.world_scale
-        world_rotation = self.world_rotation
-        world_position = self.world_position
+        world_x, world_y, _, _, _, cos_r, sin_r, inv_scale_x, inv_scale_y = self._world()
+        
+        # Translate, then rotate back (with the cached sin/cos), then scale back by the cached reciprocals
+        translated_x = world_point.x - world_x
+        translated_y = world_point.y - world_y
+        return Vector2((translated_x * cos_r + translated_y * sin_r) * inv_scale_x,
+                       (translated_y * cos_r - translated_x * sin_r) * inv_scale_y)
+    
+    def reset(self):
+        """Return to the identity transform in place, detached from any parent and children"""
+        self.parent = None
+        for child in self._children.values():
+            child._parent = None
+            child._cache_parent_ver = -1
+        self._children.clear()
+        
+        position = self.position
+        position.x = 0.0
+        position.y = 0.0
+        self.rotation = 0.0
+        scale = self.scale
+        scale.x = 1.0
+        scale.y = 1.0
+        self._quaternion_rotation = None
+        self._use_3d = False
         
-        # Translate, then rotate back, then scale back
-        translated = world_point - world_position
-        rotated = translated.rotate(-world_rotation)
-        return Vector2(rotated.x / world_scale.x, rotated.y / world_scale.y)
+        # Invalidate the cached world state so it is recomputed on next use
+        self._cache_local = None
+        self._cache_parent_ver = -1
+        self._version += 1
     
     # 3D Transform Support
     def enable_3d(self):
@@ -158,4 +258,4 @@ class Transform:
         """Get quaternion representation of current 2D rotation"""
         from .quaternion import Quaternion
         from .vector3 import Vector3
-        return Quaternion.from_axis_angle(Vector3(0, 0, 1), self.rotation)
\ No newline at end of file
+        return Quaternion.from_axis_angle(Vector3.FORWARD, self.rotation)
@@ -8,6 +8,8 @@ from typing import Union, Tuple
 class Vector2:
     """2D Vector class with mathematical operations"""
     
+    __slots__ = ('x', 'y')
+    
     def __init__(self, x: float = 0.0, y: float = 0.0):
         self.x = float(x)
         self.y = float(y)
@@ -35,8 +37,30 @@ class Vector2:
             raise ValueError("Cannot divide by zero")
         return Vector2(self.x / scalar, self.y / scalar)
     
+    # In-place operators mutate this vector, so every holder of a shared reference sees the change
+    def __iadd__(self, other: 'Vector2') -> 'Vector2':
+        self.x += other.x
+        self.y += other.y
+        return self
+    
+    def __isub__(self, other: 'Vector2') -> 'Vector2':
+        self.x -= other.x
+        self.y -= other.y
+        return self
+    
+    def __imul__(self, scalar: Union[float, int]) -> 'Vector2':
+        self.x *= scalar
+        self.y *= scalar
+        return self
+    
     def __eq__(self, other: 'Vector2') -> bool:
-        return abs(self.x - other.x) < 1e-6 and abs(self.y - other.y) < 1e-6
+        # Within 1e-6 of each other, compared squared to avoid per-component abs()
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy < 1e-12
+    
+    # Mutable, so not hashable
+    __hash__ = None
     
     def copy(self) -> 'Vector2':
         """Create a copy of this vector"""
@@ -45,7 +69,7 @@ class Vector2:
     @property
     def magnitude(self) -> float:
         """Get the magnitude (length) of the vector"""
-        return math.sqrt(self.x * self.x + self.y * self.y)
+        return math.hypot(self.x, self.y)
     
     @property
     def magnitude_squared(self) -> float:
@@ -73,11 +97,13 @@ class Vector2:
     
     def distance_to(self, other: 'Vector2') -> float:
         """Calculate distance to another vector"""
-        return (self - other).magnitude
+        return math.hypot(self.x - other.x, self.y - other.y)
     
     def distance_squared_to(self, other: 'Vector2') -> float:
         """Calculate squared distance to another vector (faster)"""
-        return (self - other).magnitude_squared
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
     
     def angle_to(self, other: 'Vector2') -> float:
         """Calculate angle to another vector in radians"""
@@ -99,7 +125,7 @@ class Vector2:
     def lerp(self, other: 'Vector2', t: float) -> 'Vector2':
         """Linear interpolation between this and another vector"""
         t = max(0, min(1, t))  # Clamp t between 0 and 1
-        return self + (other - self) * t
+        return Vector2(self.x + (other.x - self.x) * t, self.y + (other.y - self.y) * t)
     
     def to_tuple(self) -> Tuple[float, float]:
         """Convert to tuple (x, y)"""
@@ -150,4 +176,14 @@ class Vector2:
     def to_vector3(self, z: float = 0.0) -> 'Vector3':
         """Convert to Vector3 with optional z component"""
         from .vector3 import Vector3
-        return Vector3(self.x, self.y, z)
\ No newline at end of file
+        return Vector3(self.x, self.y, z)
+
+
+# Shared read-only constants for lookups that never mutate the result; the factory
+# methods above still return fresh vectors for callers that do
+Vector2.ZERO = Vector2(0, 0)
+Vector2.ONE = Vector2(1, 1)
+Vector2.UP = Vector2(0, -1)
+Vector2.DOWN = Vector2(0, 1)
+Vector2.LEFT = Vector2(-1, 0)
+Vector2.RIGHT = Vector2(1, 0)
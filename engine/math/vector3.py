@@ -3,6 +3,7 @@
 3D Vector implementation for extended math operations
 """
 import math
+from array import array
 from typing import Union, Tuple
 from .vector2 import Vector2
 
@@ -10,6 +11,8 @@ from .vector2 import Vector2
 class Vector3:
     """3D Vector class with mathematical operations"""
     
+    __slots__ = ('x', 'y', 'z')
+    
     def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
         self.x = float(x)
         self.y = float(y)
@@ -38,10 +41,34 @@ class Vector3:
             raise ValueError("Cannot divide by zero")
         return Vector3(self.x / scalar, self.y / scalar, self.z / scalar)
     
+    # In-place operators mutate this vector, so every holder of a shared reference sees the change
+    def __iadd__(self, other: 'Vector3') -> 'Vector3':
+        self.x += other.x
+        self.y += other.y
+        self.z += other.z
+        return self
+    
+    def __isub__(self, other: 'Vector3') -> 'Vector3':
+        self.x -= other.x
+        self.y -= other.y
+        self.z -= other.z
+        return self
+    
+    def __imul__(self, scalar: Union[float, int]) -> 'Vector3':
+        self.x *= scalar
+        self.y *= scalar
+        self.z *= scalar
+        return self
+    
     def __eq__(self, other: 'Vector3') -> bool:
-        return (abs(self.x - other.x) < 1e-6 and 
-                abs(self.y - other.y) < 1e-6 and 
-                abs(self.z - other.z) < 1e-6)
+        # Within 1e-6 of each other, compared squared to avoid per-component abs()
+        dx = self.x - other.x
+        dy = self.y - other.y
+        dz = self.z - other.z
+        return dx * dx + dy * dy + dz * dz < 1e-12
+    
+    # Mutable, so not hashable
+    __hash__ = None
     
     def copy(self) -> 'Vector3':
         """Create a copy of this vector"""
@@ -99,7 +126,9 @@ class Vector3:
     def lerp(self, other: 'Vector3', t: float) -> 'Vector3':
         """Linear interpolation between this and another vector"""
         t = max(0, min(1, t))  # Clamp t between 0 and 1
-        return self + (other - self) * t
+        return Vector3(self.x + (other.x - self.x) * t,
+                       self.y + (other.y - self.y) * t,
+                       self.z + (other.z - self.z) * t)
     
     def to_tuple(self) -> Tuple[float, float, float]:
         """Convert to tuple (x, y, z)"""
@@ -111,13 +140,29 @@ class Vector3:
     
     def project_onto_plane(self, plane_normal: 'Vector3') -> 'Vector3':
         """Project this vector onto a plane defined by its normal"""
-        normal = plane_normal.normalized()
-        return self - normal * self.dot(normal)
+        if abs(plane_normal.magnitude_squared - 1.0) >= 1e-6:
+            plane_normal = plane_normal.normalize()
+        return self.project_onto_plane_unit(plane_normal)
+    
+    def project_onto_plane_unit(self, plane_normal: 'Vector3') -> 'Vector3':
+        """Project this vector onto a plane, assuming plane_normal is already unit length"""
+        d = self.x * plane_normal.x + self.y * plane_normal.y + self.z * plane_normal.z
+        return Vector3(self.x - plane_normal.x * d,
+                       self.y - plane_normal.y * d,
+                       self.z - plane_normal.z * d)
     
     def reflect(self, normal: 'Vector3') -> 'Vector3':
         """Reflect this vector across a surface with given normal"""
-        normal = normal.normalized()
-        return self - 2 * self.dot(normal) * normal
+        if abs(normal.magnitude_squared - 1.0) >= 1e-6:
+            normal = normal.normalize()
+        return self.reflect_unit(normal)
+    
+    def reflect_unit(self, normal: 'Vector3') -> 'Vector3':
+        """Reflect this vector across a surface, assuming normal is already unit length"""
+        d2 = 2 * (self.x * normal.x + self.y * normal.y + self.z * normal.z)
+        return Vector3(self.x - normal.x * d2,
+                       self.y - normal.y * d2,
+                       self.z - normal.z * d2)
     
     @staticmethod
     def zero() -> 'Vector3':
@@ -163,3 +208,40 @@ class Vector3:
     def from_vector2(vec2: Vector2, z: float = 0.0) -> 'Vector3':
         """Create Vector3 from Vector2 with optional z component"""
         return Vector3(vec2.x, vec2.y, z)
+    
+    @staticmethod
+    def magnitudes(components: array) -> array:
+        """Get the magnitude of every vector in a flat array of [x, y, z] components"""
+        sqrt = math.sqrt
+        return array('d', [sqrt(components[i] * components[i] +
+                                components[i + 1] * components[i + 1] +
+                                components[i + 2] * components[i + 2])
+                           for i in range(0, len(components), 3)])
+    
+    @staticmethod
+    def normalize_batch(components: array) -> array:
+        """Normalize every vector in a flat array of [x, y, z] components in place (zero vectors are left as is)"""
+        sqrt = math.sqrt
+        for i in range(0, len(components), 3):
+            x = components[i]
+            y = components[i + 1]
+            z = components[i + 2]
+            mag_sq = x * x + y * y + z * z
+            if mag_sq > 0:
+                inv = 1.0 / sqrt(mag_sq)
+                components[i] = x * inv
+                components[i + 1] = y * inv
+                components[i + 2] = z * inv
+        return components
+
+
+# Shared read-only constants for lookups that never mutate the result; the factory
+# methods above still return fresh vectors for callers that do
+Vector3.ZERO = Vector3(0, 0, 0)
+Vector3.ONE = Vector3(1, 1, 1)
+Vector3.UP = Vector3(0, 1, 0)
+Vector3.DOWN = Vector3(0, -1, 0)
+Vector3.LEFT = Vector3(-1, 0, 0)
+Vector3.RIGHT = Vector3(1, 0, 0)
+Vector3.FORWARD = Vector3(0, 0, 1)
+Vector3.BACK = Vector3(0, 0, -1)
@@ -1,7 +1,7 @@
 """
 GameObject class - the base entity in the game world
 """
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import List, Dict, Set, Any, Optional, TYPE_CHECKING
 from ..math.transform import Transform
 from ..math.vector2 import Vector2
 
@@ -10,12 +10,51 @@ if TYPE_CHECKING:
     from ..graphics.renderer import Renderer
 
 
+# Dense integer id per component type, indexing GameObject._components_by_id
+_COMPONENT_IDS: Dict[type, int] = {}
+
+
+def register_component(component_type: type) -> type:
+    """Assign a component type its integer id (usable as a class decorator)"""
+    if component_type not in _COMPONENT_IDS:
+        _COMPONENT_IDS[component_type] = len(_COMPONENT_IDS)
+    return component_type
+
+
+# Bit position per tag string, so a set of tags packs into one int (see GameObject.tag_mask)
+_TAG_BITS: Dict[str, int] = {}
+
+
+def tag_bit(tag: str) -> int:
+    """Get the mask bit for a tag, assigning the next free bit on first use"""
+    bit = _TAG_BITS.get(tag)
+    if bit is None:
+        bit = _TAG_BITS[tag] = 1 << len(_TAG_BITS)
+    return bit
+
+
 class Component:
     """Base component class"""
     
+    __slots__ = ('game_object', '_is_active')
+    
     def __init__(self):
         self.game_object: Optional['GameObject'] = None
-        self.is_active = True
+        self._is_active = True
+    
+    @property
+    def is_active(self) -> bool:
+        """Get whether the component is updated and rendered"""
+        return self._is_active
+    
+    @is_active.setter
+    def is_active(self, active: bool):
+        """Set whether the component is updated and rendered"""
+        active = bool(active)
+        if active != self._is_active:
+            self._is_active = active
+            if self.game_object is not None:
+                self.game_object._on_component_active_changed(self)
     
     def start(self):
         """Called when the component is first added"""
@@ -37,26 +76,69 @@ class Component:
 class GameObject:
     """Base game object class"""
     
+    __slots__ = ('name', '_is_active', 'is_destroyed', '_z_order', '_render_seq', 'tags', '_tag_mask', 'transform',
+                 '_components_by_id', 'components_list', '_active_components', 'scene', '_spawned_by', 'data')
+    
     def __init__(self, name: str = "GameObject"):
         self.name = name
-        self.is_active = True
+        self._is_active = True
         self.is_destroyed = False
-        self.z_order = 0  # Render order (higher values render on top)
-        self.tags: List[str] = []
+        self._z_order = 0  # Render order (higher values render on top)
+        self._render_seq = 0  # Scene insertion order, breaks z-order ties
+        self.tags: Set[str] = set()
+        self._tag_mask = 0  # OR of tag_bit() over tags
         
         # Transform component (always present)
         self.transform = Transform()
         
-        # Components
-        self.components: Dict[type, Component] = {}
+        # Components, indexed by component type id (see register_component)
+        self._components_by_id: List[Optional[Component]] = [None] * len(_COMPONENT_IDS)
         self.components_list: List[Component] = []
+        self._active_components: List[Component] = []  # Active subset, in components_list order
         
-        # Scene reference
+        # Scene reference, and the scene that spawned the object (and may recycle it)
         self.scene: Optional['Scene'] = None
+        self._spawned_by: Optional['Scene'] = None
         
         # Custom data storage
         self.data: Dict[str, Any] = {}
     
+    @property
+    def components(self) -> Dict[type, Component]:
+        """Get components by type"""
+        return {type(component): component for component in self.components_list}
+    
+    @property
+    def is_active(self) -> bool:
+        """Get whether the object is updated and rendered"""
+        return self._is_active
+    
+    @is_active.setter
+    def is_active(self, active: bool):
+        """Set whether the object is updated and rendered"""
+        active = bool(active)
+        if active != self._is_active:
+            self._is_active = active
+            if self.scene is not None:
+                self.scene._on_object_active_changed(self)
+    
+    @property
+    def tag_mask(self) -> int:
+        """Get the tag bitmask (test with tag_bit(tag), or several OR'd bits for any-of)"""
+        return self._tag_mask
+    
+    @property
+    def z_order(self) -> int:
+        """Get render order (higher values render on top)"""
+        return self._z_order
+    
+    @z_order.setter
+    def z_order(self, z_order: int):
+        """Set render order, marking the scene's render order for resorting"""
+        self._z_order = z_order
+        if self.scene is not None:
+            self.scene._render_dirty = True
+    
     def start(self):
         """Called when the object is first created"""
         for component in self.components_list:
@@ -64,87 +146,116 @@ class GameObject:
     
     def update(self, delta_time: float):
         """Update the game object and all its components"""
-        if not self.is_active or self.is_destroyed:
+        # Inside a scene, components are updated from the scene's component pools
+        if not self.is_active or self.is_destroyed or self.scene is not None:
             return
         
-        for component in self.components_list:
-            if component.is_active:
-                component.update(delta_time)
+        for component in self._active_components:
+            component.update(delta_time)
     
     def render(self, renderer: 'Renderer'):
         """Render the game object and all its components"""
         if not self.is_active or self.is_destroyed:
             return
         
-        for component in self.components_list:
-            if component.is_active:
-                component.render(renderer)
+        for component in self._active_components:
+            component.render(renderer)
     
     def add_component(self, component: Component) -> Component:
         """Add a component to the game object"""
         component_type = type(component)
+        type_id = _COMPONENT_IDS.get(component_type)
+        if type_id is None:
+            register_component(component_type)
+            type_id = _COMPONENT_IDS[component_type]
+        
+        components_by_id = self._components_by_id
+        if type_id >= len(components_by_id):
+            components_by_id.extend([None] * (len(_COMPONENT_IDS) - len(components_by_id)))
         
         # Remove existing component of the same type
-        if component_type in self.components:
+        if components_by_id[type_id] is not None:
             self.remove_component(component_type)
         
         # Add new component
-        self.components[component_type] = component
+        components_by_id[type_id] = component
         self.components_list.append(component)
+        if component.is_active:
+            self._active_components.append(component)
         component.game_object = self
         
         # Initialize if object is already started
         if self.scene:
+            if component.is_active and self._is_active and not self.is_destroyed:
+                self.scene._register_component(component)
             component.start()
         
         return component
     
     def get_component(self, component_type: type) -> Optional[Component]:
         """Get a component of the specified type"""
-        return self.components.get(component_type)
+        type_id = _COMPONENT_IDS.get(component_type)
+        if type_id is None or type_id >= len(self._components_by_id):
+            return None
+        return self._components_by_id[type_id]
     
     def has_component(self, component_type: type) -> bool:
         """Check if the object has a component of the specified type"""
-        return component_type in self.components
+        return self.get_component(component_type) is not None
     
     def remove_component(self, component_type: type) -> bool:
         """Remove a component of the specified type"""
-        if component_type in self.components:
-            component = self.components[component_type]
+        component = self.get_component(component_type)
+        if component is not None:
             component.destroy()
-            del self.components[component_type]
+            self._components_by_id[_COMPONENT_IDS[component_type]] = None
             self.components_list.remove(component)
+            if component.is_active:
+                self._active_components.remove(component)
+            if self.scene:
+                self.scene._unregister_component(component)
             component.game_object = None
             return True
         return False
     
+    def _on_component_active_changed(self, component: Component):
+        """Move a component into or out of the active views after its is_active changed"""
+        # Rebuilt rather than swap-removed so components keep their render order
+        self._active_components = [c for c in self.components_list if c.is_active]
+        if self.scene:
+            if component.is_active and self._is_active and not self.is_destroyed:
+                self.scene._register_component(component)
+            else:
+                self.scene._unregister_component(component)
+    
     def add_tag(self, tag: str):
         """Add a tag to the object"""
         if tag not in self.tags:
-            self.tags.append(tag)
+            self.tags.add(tag)
+            self._tag_mask |= tag_bit(tag)
             
             # Update scene indices
             if self.scene:
-                if tag not in self.scene.objects_by_tag:
-                    self.scene.objects_by_tag[tag] = []
-                self.scene.objects_by_tag[tag].append(self)
+                self.scene._index_tag(self, tag)
     
     def remove_tag(self, tag: str):
         """Remove a tag from the object"""
         if tag in self.tags:
-            self.tags.remove(tag)
+            self.tags.discard(tag)
+            self._tag_mask &= ~tag_bit(tag)
             
             # Update scene indices
-            if self.scene and tag in self.scene.objects_by_tag:
-                if self in self.scene.objects_by_tag[tag]:
-                    self.scene.objects_by_tag[tag].remove(self)
-                if not self.scene.objects_by_tag[tag]:
-                    del self.scene.objects_by_tag[tag]
+            if self.scene:
+                self.scene._unindex_tag(self, tag)
     
     def has_tag(self, tag: str) -> bool:
         """Check if the object has a specific tag"""
         return tag in self.tags
     
+    def has_any_tag(self, mask: int) -> bool:
+        """Check if the object has any of the tags in a mask built from tag_bit"""
+        return (self._tag_mask & mask) != 0
+    
     def destroy(self):
         """Mark the object for destruction"""
         if self.is_destroyed:
@@ -155,9 +266,33 @@ class GameObject:
         # Destroy all components
         for component in self.components_list.copy():
             component.destroy()
+            if self.scene:
+                self.scene._unregister_component(component)
         
-        self.components.clear()
+        components_by_id = self._components_by_id
+        for i in range(len(components_by_id)):
+            components_by_id[i] = None
         self.components_list.clear()
+        self._active_components.clear()
+        
+        if self.scene:
+            self.scene._on_object_destroyed(self)
+    
+    def reset(self):
+        """Return a destroyed, scene-less object to a fresh state with no components,
+        reusing its transform and containers rather than allocating new ones"""
+        self._is_active = True
+        self.is_destroyed = False
+        self._z_order = 0
+        self.tags.clear()
+        self._tag_mask = 0
+        self.transform.reset()
+        self.data.clear()
+    
+    def reinitialize(self, name: str = "GameObject"):
+        """Prepare a recycled, reset object for reuse by Scene.spawn. Subclasses that are
+        spawned override this to restore their own state and re-add their components"""
+        self.name = name
     
     def set_active(self, active: bool):
         """Set the active state of the object"""
@@ -196,4 +331,4 @@ class GameObject:
         return self.transform.scale
     
     def __str__(self) -> str:
-        return f"GameObject(name='{self.name}', active={self.is_active}, components={len(self.components)})"
\ No newline at end of file
+        return f"GameObject(name='{self.name}', active={self.is_active}, components={len(self.components_list)})"
\ No newline at end of file
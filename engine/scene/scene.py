@@ -1,8 +1,10 @@
 """
 Scene class for managing game objects and game state
 """
+from collections import defaultdict
+from operator import attrgetter
 from typing import List, Dict, Optional, Any
-from .game_object import GameObject
+from .game_object import GameObject, Component
 from ..graphics.renderer import Renderer
 
 
@@ -13,7 +15,35 @@ class Scene:
         self.name = name
         self.game_objects: List[GameObject] = []
         self.objects_by_name: Dict[str, GameObject] = {}
-        self.objects_by_tag: Dict[str, List[GameObject]] = {}
+        self.objects_by_tag: Dict[str, List[GameObject]] = defaultdict(list)
+        self.objects_by_type: Dict[type, List[GameObject]] = defaultdict(list)  # every class in each object's MRO
+        self._pools: Dict[type, List[Component]] = {}  # component type -> components of that type
+        self._pool_list: List[List[Component]] = []  # Same pools, iterable while new types are added
+        
+        # id(item) -> position in its list, for O(1) swap-remove (see _swap_remove)
+        self._object_positions: Dict[int, int] = {}
+        self._tag_positions: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self._type_positions: Dict[type, Dict[int, int]] = defaultdict(dict)
+        self._pool_positions: Dict[int, int] = {}
+        
+        # Active, not destroyed objects: the only ones updated, rendered or with pooled components
+        self._active_objects: List[GameObject] = []
+        self._active_positions: Dict[int, int] = {}
+        # Objects and components taken out during update(): skipped, then removed from the
+        # active list and pools after it
+        self._deferring_active = False
+        self._pending_removal: Dict[int, GameObject] = {}
+        self._pending_unregister: Dict[int, Component] = {}
+        # Objects destroyed since the last cleanup
+        self._destroyed: List[GameObject] = []
+        
+        # Active objects sorted by z-order, rebuilt only when they or their z-order change
+        self._render_order: List[GameObject] = []
+        self._render_dirty = True
+        self._next_render_seq = 0  # Objects with equal z-order render in the order they were added
+        
+        # Destroyed spawned objects kept for reuse by spawn()
+        self._object_pool: Dict[type, List[GameObject]] = defaultdict(list)
         self.is_active = True
         self.data: Dict[str, Any] = {}  # For storing scene-specific data
         
@@ -24,9 +54,12 @@ class Scene:
     
     def add_object(self, game_object: GameObject):
         """Add a game object to the scene"""
-        if game_object not in self.game_objects:
-            self.game_objects.append(game_object)
+        if id(game_object) not in self._object_positions:
+            _indexed_append(self.game_objects, self._object_positions, game_object)
             game_object.scene = self
+            game_object._render_seq = self._next_render_seq
+            self._next_render_seq += 1
+            self._render_dirty = True
             
             # Index by name
             if game_object.name:
@@ -34,15 +67,25 @@ class Scene:
             
             # Index by tags
             for tag in game_object.tags:
-                if tag not in self.objects_by_tag:
-                    self.objects_by_tag[tag] = []
-                self.objects_by_tag[tag].append(game_object)
+                self._index_tag(game_object, tag)
+            
+            # Index by type and base types
+            for cls in type(game_object).__mro__:
+                if cls is object:
+                    break
+                _indexed_append(self.objects_by_type[cls], self._type_positions[cls], game_object)
+            
+            if game_object.is_destroyed:
+                self._destroyed.append(game_object)
+            else:
+                self._sync_active(game_object)
     
     def remove_object(self, game_object: GameObject):
         """Remove a game object from the scene"""
-        if game_object in self.game_objects:
-            self.game_objects.remove(game_object)
+        if _swap_remove(self.game_objects, self._object_positions, game_object):
             game_object.scene = None
+            game_object._spawned_by = None  # Removed objects are no longer recycled
+            self._render_dirty = True
             
             # Remove from name index
             if game_object.name in self.objects_by_name:
@@ -50,11 +93,108 @@ class Scene:
             
             # Remove from tag indices
             for tag in game_object.tags:
-                if tag in self.objects_by_tag:
-                    if game_object in self.objects_by_tag[tag]:
-                        self.objects_by_tag[tag].remove(game_object)
-                    if not self.objects_by_tag[tag]:
-                        del self.objects_by_tag[tag]
+                self._unindex_tag(game_object, tag)
+            
+            # Remove from type indices
+            for cls in type(game_object).__mro__:
+                if cls is object:
+                    break
+                _swap_remove(self.objects_by_type[cls], self._type_positions[cls], game_object)
+            
+            self._remove_active(game_object)
+            for component in game_object.components_list:
+                self._unregister_component(component)
+    
+    def spawn(self, object_type: type, *args, **kwargs) -> GameObject:
+        """Create an object of the given type and add it to the scene, reusing a recycled one
+        when available. Only spawned objects are recycled once destroyed, so do not keep
+        references to them after destroying them."""
+        pool = self._object_pool.get(object_type)
+        if pool:
+            game_object = pool.pop()
+            game_object.reinitialize(*args, **kwargs)
+        else:
+            game_object = object_type(*args, **kwargs)
+        
+        self.add_object(game_object)
+        game_object._spawned_by = self
+        return game_object
+    
+    def _recycle(self, game_object: GameObject):
+        """Reset a destroyed, spawned object and keep it for reuse"""
+        game_object.reset()
+        self._object_pool[type(game_object)].append(game_object)
+    
+    def _index_tag(self, game_object: GameObject, tag: str):
+        """Add an object to the list for a tag"""
+        _indexed_append(self.objects_by_tag[tag], self._tag_positions[tag], game_object)
+    
+    def _unindex_tag(self, game_object: GameObject, tag: str):
+        """Remove an object from the list for a tag"""
+        if tag in self.objects_by_tag:
+            _swap_remove(self.objects_by_tag[tag], self._tag_positions[tag], game_object)
+            if not self.objects_by_tag[tag]:
+                del self.objects_by_tag[tag]
+                del self._tag_positions[tag]
+    
+    def _on_object_active_changed(self, game_object: GameObject):
+        """Apply a change to whether an object is active and alive"""
+        # During update() removals are queued by _remove_active and _unregister_component
+        self._sync_active(game_object)
+    
+    def _on_object_destroyed(self, game_object: GameObject):
+        """Queue a destroyed object for removal and stop updating it"""
+        self._destroyed.append(game_object)
+        self._on_object_active_changed(game_object)
+    
+    def _sync_active(self, game_object: GameObject):
+        """Move an object and its active components into or out of the active views"""
+        if game_object._is_active and not game_object.is_destroyed:
+            if id(game_object) not in self._active_positions:
+                _indexed_append(self._active_objects, self._active_positions, game_object)
+                self._render_dirty = True
+            else:
+                # Still listed; cancel a removal queued during this update
+                self._pending_removal.pop(id(game_object), None)
+            for component in game_object._active_components:
+                self._register_component(component)
+        elif self._remove_active(game_object):
+            for component in game_object._active_components:
+                self._unregister_component(component)
+    
+    def _remove_active(self, game_object: GameObject) -> bool:
+        """Take an object out of the active list, or queue that while update() iterates it"""
+        if id(game_object) not in self._active_positions:
+            return False
+        if self._deferring_active:
+            self._pending_removal[id(game_object)] = game_object
+        else:
+            _swap_remove(self._active_objects, self._active_positions, game_object)
+        self._render_dirty = True
+        return True
+    
+    def _register_component(self, component: Component):
+        """Add a component to the pool for its type"""
+        if id(component) in self._pool_positions:
+            # Still pooled; cancel a removal queued during this update
+            self._pending_unregister.pop(id(component), None)
+            return
+        pool = self._pools.get(type(component))
+        if pool is None:
+            # Not a defaultdict: a new pool must also be appended to _pool_list
+            pool = self._pools[type(component)] = []
+            self._pool_list.append(pool)
+        _indexed_append(pool, self._pool_positions, component)
+    
+    def _unregister_component(self, component: Component):
+        """Remove a component from the pool for its type"""
+        if self._deferring_active:
+            if id(component) in self._pool_positions:
+                self._pending_unregister[id(component)] = component
+            return
+        pool = self._pools.get(type(component))
+        if pool:
+            _swap_remove(pool, self._pool_positions, component)
     
     def find_object(self, name: str) -> Optional[GameObject]:
         """Find a game object by name"""
@@ -64,19 +204,67 @@ class Scene:
         """Find all game objects with a specific tag"""
         return self.objects_by_tag.get(tag, []).copy()
     
+    def find_objects_with_tag_view(self, tag: str) -> List[GameObject]:
+        """Find all game objects with a specific tag without copying (do not modify the list)"""
+        return self.objects_by_tag.get(tag, _EMPTY_LIST)
+    
     def find_objects_of_type(self, object_type: type) -> List[GameObject]:
         """Find all game objects of a specific type"""
-        return [obj for obj in self.game_objects if isinstance(obj, object_type)]
+        return self.objects_by_type.get(object_type, []).copy()
     
     def update(self, delta_time: float):
         """Update all game objects in the scene"""
         if not self.is_active:
             return
         
-        # Update all objects (copy list to handle modifications during iteration)
-        for obj in self.game_objects.copy():
-            if obj.is_active:
-                obj.update(delta_time)
+        # Removals from the active list and pools made while iterating are applied once both
+        # passes finish, so the lists below never shrink mid-loop; removed, deactivated and
+        # destroyed objects and components are skipped until then. Anything added during the
+        # loop lands past the captured counts and first updates next frame.
+        self._deferring_active = True
+        try:
+            # Update components pool by pool, in the order they were registered. Pools only
+            # hold active components of active objects, see _sync_active.
+            pending_unregister = self._pending_unregister
+            pool_list = self._pool_list
+            for p in range(len(pool_list)):
+                if p >= len(pool_list):
+                    break  # The scene was cleaned up mid-update
+                pool = pool_list[p]
+                for i in range(len(pool)):
+                    if i >= len(pool):
+                        break  # The scene was cleaned up mid-update
+                    component = pool[i]
+                    if pending_unregister and id(component) in pending_unregister:
+                        continue
+                    component.update(delta_time)
+            
+            # Then run per-object logic, only for objects that override update
+            base_update = GameObject.update
+            active_objects = self._active_objects
+            pending_removal = self._pending_removal
+            for i in range(len(active_objects)):
+                if i >= len(active_objects):
+                    break  # The scene was cleaned up mid-update
+                obj = active_objects[i]
+                if type(obj).update is not base_update:
+                    if not obj._is_active or (pending_removal and id(obj) in pending_removal):
+                        continue
+                    obj.update(delta_time)
+        finally:
+            self._deferring_active = False
+        
+        pending_removal = self._pending_removal
+        if pending_removal:
+            for obj in pending_removal.values():
+                _swap_remove(self._active_objects, self._active_positions, obj)
+            pending_removal.clear()
+        
+        pending_unregister = self._pending_unregister
+        if pending_unregister:
+            for component in pending_unregister.values():
+                self._unregister_component(component)
+            pending_unregister.clear()
         
         # Remove destroyed objects
         self._cleanup_destroyed_objects()
@@ -86,29 +274,58 @@ class Scene:
         if not self.is_active:
             return
         
-        # Sort objects by z-order (render order)
-        sorted_objects = sorted(
-            [obj for obj in self.game_objects if obj.is_active],
-            key=lambda obj: obj.z_order
-        )
+        # Sort objects by z-order (render order) only when it may have changed
+        if self._render_dirty:
+            render_order = self._render_order
+            render_order[:] = self._active_objects
+            render_order.sort(key=_z_order_key)
+            self._render_dirty = False
         
-        # Render all objects
-        for obj in sorted_objects:
-            obj.render(renderer)
+        # Render all active objects, submitting their draws to the canvas in one batch
+        renderer.begin_batch()
+        try:
+            for obj in self._render_order:
+                obj.render(renderer)
+        finally:
+            renderer.end_batch()
     
     def _cleanup_destroyed_objects(self):
         """Remove destroyed objects from the scene"""
-        destroyed_objects = [obj for obj in self.game_objects if obj.is_destroyed]
-        for obj in destroyed_objects:
-            self.remove_object(obj)
+        destroyed = self._destroyed
+        if not destroyed:
+            return
+        
+        for obj in destroyed:
+            if obj.scene is self:
+                spawned = obj._spawned_by is self
+                self.remove_object(obj)
+                if spawned:
+                    self._recycle(obj)
+        destroyed.clear()
     
     def cleanup(self):
         """Cleanup the scene"""
-        for obj in self.game_objects.copy():
-            obj.destroy()
+        game_objects = self.game_objects
+        for i in range(len(game_objects) - 1, -1, -1):
+            game_objects[i].destroy()
         self.game_objects.clear()
         self.objects_by_name.clear()
         self.objects_by_tag.clear()
+        self.objects_by_type.clear()
+        self._pools.clear()
+        self._pool_list.clear()
+        self._object_positions.clear()
+        self._tag_positions.clear()
+        self._type_positions.clear()
+        self._pool_positions.clear()
+        self._active_objects.clear()
+        self._active_positions.clear()
+        self._pending_removal.clear()
+        self._pending_unregister.clear()
+        self._destroyed.clear()
+        self._render_order.clear()
+        self._render_dirty = True
+        self._object_pool.clear()
     
     def set_active(self, active: bool):
         """Set scene active state"""
@@ -120,4 +337,26 @@ class Scene:
     
     def get_active_object_count(self) -> int:
         """Get the number of active objects in the scene"""
-        return len([obj for obj in self.game_objects if obj.is_active])
\ No newline at end of file
+        return len(self._active_objects)
+
+
+_z_order_key = attrgetter('_z_order', '_render_seq')
+_EMPTY_LIST: List = []
+
+
+def _indexed_append(items: List, positions: Dict[int, int], item):
+    """Append an item to a list and record its position"""
+    positions[id(item)] = len(items)
+    items.append(item)
+
+
+def _swap_remove(items: List, positions: Dict[int, int], item) -> bool:
+    """Remove an item from a list in O(1) by moving the last item into its slot"""
+    index = positions.pop(id(item), None)
+    if index is None:
+        return False
+    last = items.pop()
+    if last is not item:
+        items[index] = last
+        positions[id(last)] = index
+    return True
@@ -15,8 +15,12 @@ import math
 class ECSGame(GameEngine):
     """ECS-based game example"""
     
+    TITLE_INTERVAL = 0.1  # Seconds between window title refreshes
+    
     def initialize(self):
         """Initialize the ECS world and create entities"""
+        self._title_accum = 0.0
+        
         # Create ECS world
         self.world = World()
         
@@ -120,10 +124,13 @@ class ECSGame(GameEngine):
         if self.input_manager.is_key_just_pressed('escape'):
             self.quit()
         
-        # Update window title with entity count
-        entity_count = len(self.world.get_all_entities())
-        fps = self.get_fps()
-        self.window.set_title(f"ECS Demo - Entities: {entity_count} - FPS: {fps:.1f}")
+        # Update window title with entity count, a few times a second rather than every frame
+        self._title_accum += delta_time
+        if self._title_accum >= self.TITLE_INTERVAL:
+            self._title_accum = 0.0
+            entity_count = len(self.world.get_all_entities())
+            fps = self.get_fps()
+            self.window.set_title(f"ECS Demo - Entities: {entity_count} - FPS: {fps:.1f}")
     
     def handle_player_input(self, delta_time: float):
         """Handle player input using ECS"""
@@ -137,21 +144,24 @@ class ECSGame(GameEngine):
     
     def update_enemy_patterns(self, delta_time: float):
         """Update enemy movement patterns"""
-        enemies = self.world.get_entities_with_components(TransformComponent, VelocityComponent, TagComponent)
-        
-        for enemy in enemies:
-            tag_comp = self.world.get_component(enemy, TagComponent)
-            if tag_comp and tag_comp.has_tag('enemy'):
-                velocity_comp = self.world.get_component(enemy, VelocityComponent)
-                transform_comp = self.world.get_component(enemy, TransformComponent)
-                
-                if velocity_comp and transform_comp:
-                    # Add some circular motion
-                    current_angle = math.atan2(velocity_comp.velocity.y, velocity_comp.velocity.x)
-                    new_angle = current_angle + delta_time * 2.0  # Rotate over time
-                    speed = velocity_comp.velocity.magnitude
-                    
-                    velocity_comp.velocity = Vector2.from_angle(new_angle, speed)
+        # Add some circular motion: every enemy turns by the same angle this frame, so
+        # rotate the velocities directly with one sin/cos pair instead of atan2 + from_angle
+        turn = delta_time * 2.0
+        cos_t = math.cos(turn)
+        sin_t = math.sin(turn)
+        world = self.world
+        world_get = world.get_component
+        
+        # Only enemies are visited, straight from the world's tag index
+        for enemy in world.get_entities_with_tag('enemy'):
+            velocity_comp = world_get(enemy, VelocityComponent)
+            
+            if velocity_comp:
+                velocity = velocity_comp.velocity
+                vx = velocity.x
+                vy = velocity.y
+                velocity.x = vx * cos_t - vy * sin_t
+                velocity.y = vx * sin_t + vy * cos_t
 
 
 if __name__ == "__main__":
@@ -4,6 +4,8 @@ Example game demonstrating the Pure Python 2D Game Engine
 import math
 from engine import GameEngine, GameObject, Vector2, Transform, Sprite
 
+_HALF_PI = math.pi / 2
+
 
 class Player(GameObject):
     """Player game object with movement"""
@@ -19,46 +21,57 @@ class Player(GameObject):
         
         # Set initial position
         self.transform.position = Vector2(400, 300)
+        
+        # Input manager, looked up once when the scene starts the object
+        self._input = None
+    
+    def start(self):
+        super().start()
+        engine = getattr(self.scene, 'engine', None)
+        self._input = engine.input_manager if engine is not None else None
     
     def update(self, delta_time: float):
         super().update(delta_time)
         
         # Get input from the engine
-        if hasattr(self.scene, 'engine'):
-            input_manager = self.scene.engine.input_manager
+        input_manager = self._input
+        if input_manager is not None:
+            transform = self.transform
             
             # Movement
-            movement = input_manager.get_movement_vector()
-            if movement.magnitude > 0:
-                self.transform.translate(movement * self.speed * delta_time)
+            move_x, move_y = input_manager.get_movement_xy()
+            if move_x or move_y:
+                step = self.speed * delta_time
+                transform.translate_xy(move_x * step, move_y * step)
             
             # Rotation
-            if input_manager.is_key_pressed('q'):
-                self.transform.rotate(-self.rotation_speed * delta_time)
-            if input_manager.is_key_pressed('e'):
-                self.transform.rotate(self.rotation_speed * delta_time)
+            is_key_pressed = input_manager.is_key_pressed
+            turn = self.rotation_speed * delta_time
+            if is_key_pressed('q'):
+                transform.rotate(-turn)
+            if is_key_pressed('e'):
+                transform.rotate(turn)
             
-            # Keep player in bounds
-            pos = self.transform.position
-            if pos.x < 0:
-                pos.x = 800
-            elif pos.x > 800:
-                pos.x = 0
-            if pos.y < 0:
-                pos.y = 600
-            elif pos.y > 600:
-                pos.y = 0
+            # Keep player in bounds (wrap around the screen)
+            pos = transform.position
+            pos.x %= 800.0
+            pos.y %= 600.0
 
 
 class Enemy(GameObject):
     """Simple enemy that moves in a circle"""
     
+    # (step angle, cos, sin) of the last per-frame turn, shared by enemies with the same speed
+    _turn = [0.0, 1.0, 0.0]
+    
     def __init__(self, name: str = "Enemy", center: Vector2 = None, radius: float = 100):
         super().__init__(name)
         self.center = center or Vector2(400, 300)
         self.radius = radius
         self.angle = 0.0
         self.speed = 2.0  # radians per second
+        self._cos = 1.0  # cos/sin of angle, advanced by rotation each frame
+        self._sin = 0.0
         
         # Add sprite component with red color
         sprite = Sprite(color='#FF3232', size=Vector2(30, 30), shape='circle')  # Red enemy
@@ -70,20 +83,44 @@ class Enemy(GameObject):
     def update(self, delta_time: float):
         super().update(delta_time)
         
-        # Move in a circle
-        self.angle += self.speed * delta_time
-        offset = Vector2.from_angle(self.angle, self.radius)
-        self.transform.position = self.center + offset
+        # Move in a circle, turning the cached cos/sin by this frame's step. Every enemy
+        # takes the same step each frame, so only the first one pays for the trig.
+        step = self.speed * delta_time
+        turn = Enemy._turn
+        if turn[0] != step:
+            turn[0] = step
+            turn[1] = math.cos(step)
+            turn[2] = math.sin(step)
+        turn_cos = turn[1]
+        turn_sin = turn[2]
+        c = self._cos
+        s = self._sin
+        c, s = c * turn_cos - s * turn_sin, c * turn_sin + s * turn_cos
+        self._cos = c
+        self._sin = s
+        angle = self.angle + step
+        self.angle = angle
+        
+        transform = self.transform
+        center = self.center
+        radius = self.radius
+        position = transform.position
+        position.x = center.x + radius * c
+        position.y = center.y + radius * s
         
         # Rotate to face movement direction
-        self.transform.rotation = self.angle + math.pi / 2
+        transform.rotation = angle + _HALF_PI
 
 
 class ExampleGame(GameEngine):
     """Example game class"""
     
+    TITLE_INTERVAL = 0.1  # Seconds between window title refreshes
+    
     def initialize(self):
         """Initialize the game"""
+        self._title_accum = 0.0
+        
         # Create player
         player = Player("Player")
         self.current_scene.add_object(player)
@@ -122,9 +159,12 @@ class ExampleGame(GameEngine):
             self.set_vsync(not current_vsync)
             print(f"VSync {'enabled' if not current_vsync else 'disabled'}")
         
-        # Update window title with FPS
-        fps = self.get_fps()
-        self.window.set_title(f"Pure Python 2D Game Engine - FPS: {fps:.1f}")
+        # Update window title with FPS, a few times a second rather than every frame
+        self._title_accum += delta_time
+        if self._title_accum >= self.TITLE_INTERVAL:
+            self._title_accum = 0.0
+            fps = self.get_fps()
+            self.window.set_title(f"Pure Python 2D Game Engine - FPS: {fps:.1f}")
 
 
 if __name__ == "__main__":
@@ -18,41 +18,58 @@ class InputTestPlayer(GameObject):
         self.add_component(sprite)
         self.transform.position = Vector2(400, 300)
         
+        # Input manager, looked up once when the scene starts the object
+        self._input = None
+    
+    def start(self):
+        super().start()
+        engine = getattr(self.scene, 'engine', None)
+        self._input = engine.input_manager if engine is not None else None
+    
     def update(self, delta_time: float):
         super().update(delta_time)
         
-        if hasattr(self.scene, 'engine'):
-            input_manager = self.scene.engine.input_manager
+        input_manager = self._input
+        if input_manager is not None:
+            transform = self.transform
+            rotation_speed = self.rotation_speed
             
             # Use action-based input (works with any profile)
             movement = input_manager.get_action_movement_vector()
             if movement.magnitude > 0:
-                self.transform.translate(movement * self.speed * delta_time)
+                transform.translate(movement * self.speed * delta_time)
             
             # Action-based rotation
-            if input_manager.is_action_pressed("rotate_left"):
-                self.transform.rotate(-self.rotation_speed * delta_time)
-            if input_manager.is_action_pressed("rotate_right"):
-                self.transform.rotate(self.rotation_speed * delta_time)
+            is_action_pressed = input_manager.is_action_pressed
+            if is_action_pressed("rotate_left"):
+                transform.rotate(-rotation_speed * delta_time)
+            if is_action_pressed("rotate_right"):
+                transform.rotate(rotation_speed * delta_time)
             
             # Gamepad-specific input
             if input_manager.is_gamepad_connected(0):
                 # Use right stick for rotation
-                right_stick = input_manager.get_gamepad_stick("right", 0)
-                if abs(right_stick.x) > 0.2:  # Dead zone
-                    self.transform.rotate(right_stick.x * self.rotation_speed * delta_time)
+                stick_x = input_manager.get_gamepad_stick("right", 0).x
+                if abs(stick_x) > 0.2:  # Dead zone
+                    transform.rotate(stick_x * rotation_speed * delta_time)
             
             # Keep in bounds
-            pos = self.transform.position
-            pos.x = max(20, min(780, pos.x))
-            pos.y = max(20, min(580, pos.y))
+            pos = transform.position
+            x = pos.x
+            y = pos.y
+            pos.x = 20.0 if x < 20.0 else (780.0 if x > 780.0 else x)
+            pos.y = 20.0 if y < 20.0 else (580.0 if y > 580.0 else y)
 
 
 class InputProfileDemo(GameEngine):
     """Demo showing input profiles and gamepad support"""
     
+    TITLE_INTERVAL = 0.1  # Seconds between window title refreshes
+    
     def initialize(self):
         """Initialize the demo"""
+        self._title_accum = 0.0
+        
         # Create test player
         player = InputTestPlayer("TestPlayer")
         self.current_scene.add_object(player)
@@ -109,10 +126,13 @@ class InputProfileDemo(GameEngine):
         if self.input_manager.is_key_just_pressed('escape'):
             self.quit()
         
-        # Update window title with current profile
-        profile_name = self.input_manager.get_active_profile().name
-        fps = self.get_fps()
-        self.window.set_title(f"Input Demo - Profile: {profile_name} - FPS: {fps:.1f}")
+        # Update window title with current profile, a few times a second rather than every frame
+        self._title_accum += delta_time
+        if self._title_accum >= self.TITLE_INTERVAL:
+            self._title_accum = 0.0
+            profile_name = self.input_manager.get_active_profile().name
+            fps = self.get_fps()
+            self.window.set_title(f"Input Demo - Profile: {profile_name} - FPS: {fps:.1f}")
 
 
 if __name__ == "__main__":
@@ -3,6 +3,15 @@
 Example demonstrating the logging system
 """
 from engine import GameEngine, GameObject, Vector2, Sprite, Scene, get_logger, LogLevel, set_global_log_level
+from engine.core.logger import enable_queued_output, enable_colors, configure_timestamps
+
+# Number key -> (log level to set, level the confirmation is logged at)
+_KEY_TO_LEVEL = {
+    '1': (LogLevel.DEBUG, LogLevel.INFO),
+    '2': (LogLevel.INFO, LogLevel.INFO),
+    '3': (LogLevel.WARNING, LogLevel.WARNING),
+    '4': (LogLevel.ERROR, LogLevel.ERROR),
+}
 
 
 class LoggingTestObject(GameObject):
@@ -24,18 +33,24 @@ class LoggingTestObject(GameObject):
     def update(self, delta_time: float):
         super().update(delta_time)
         
+        previous_second = int(self.update_timer)
         self.update_timer += delta_time
+        second = int(self.update_timer)
         
-        # Log different levels based on time
-        if int(self.update_timer) % 5 == 0 and self.update_timer - delta_time < int(self.update_timer):
-            if int(self.update_timer) % 20 == 0:
-                self.logger.error("This is an error message (every 20 seconds)")
-            elif int(self.update_timer) % 15 == 0:
-                self.logger.warning("This is a warning message (every 15 seconds)")
-            elif int(self.update_timer) % 10 == 0:
-                self.logger.info("This is an info message (every 10 seconds)")
-            else:
-                self.logger.debug("This is a debug message (every 5 seconds)")
+        # Log different levels based on time, only when a 5-second boundary is crossed
+        if second != previous_second and second % 5 == 0:
+            logger = self.logger
+            if second % 20 == 0:
+                if logger.is_enabled_for(LogLevel.ERROR):
+                    logger.error("This is an error message (every 20 seconds)")
+            elif second % 15 == 0:
+                if logger.is_enabled_for(LogLevel.WARNING):
+                    logger.warning("This is a warning message (every 15 seconds)")
+            elif second % 10 == 0:
+                if logger.is_enabled_for(LogLevel.INFO):
+                    logger.info("This is an info message (every 10 seconds)")
+            elif logger.is_enabled_for(LogLevel.DEBUG):
+                logger.debug("This is a debug message (every 5 seconds)")
 
 
 class LoggingDemo(GameEngine):
@@ -43,6 +58,11 @@ class LoggingDemo(GameEngine):
     
     def initialize(self):
         """Initialize the demo"""
+        # Write log output on a background thread so logging never blocks a frame
+        enable_queued_output()
+        
+        self._title_fps = None  # FPS shown in the window title
+        
         # Get demo logger
         self.demo_logger = get_logger("Demo")
         
@@ -73,31 +93,18 @@ class LoggingDemo(GameEngine):
     def update(self, delta_time: float):
         """Update demo"""
         # Log level controls
-        if self.input_manager.is_key_just_pressed('1'):
-            set_global_log_level(LogLevel.DEBUG)
-            self.demo_logger.info("Log level set to DEBUG")
-            
-        if self.input_manager.is_key_just_pressed('2'):
-            set_global_log_level(LogLevel.INFO)
-            self.demo_logger.info("Log level set to INFO")
-            
-        if self.input_manager.is_key_just_pressed('3'):
-            set_global_log_level(LogLevel.WARNING)
-            self.demo_logger.warning("Log level set to WARNING")
-            
-        if self.input_manager.is_key_just_pressed('4'):
-            set_global_log_level(LogLevel.ERROR)
-            self.demo_logger.error("Log level set to ERROR")
+        for key, (level, message_level) in _KEY_TO_LEVEL.items():
+            if self.input_manager.is_key_just_pressed(key):
+                set_global_log_level(level)
+                self.demo_logger.log(message_level, f"Log level set to {level.name}")
         
         # Toggle features
         if self.input_manager.is_key_just_pressed('c'):
             # This is a simple toggle - in a real implementation you'd track state
-            from engine.core.logger import enable_colors
             enable_colors(False)  # For demo, just disable colors
             self.demo_logger.info("Colors toggled")
             
         if self.input_manager.is_key_just_pressed('t'):
-            from engine.core.logger import configure_timestamps
             configure_timestamps(False)  # For demo, just disable timestamps
             self.demo_logger.info("Timestamps toggled")
         
@@ -106,9 +113,11 @@ class LoggingDemo(GameEngine):
             self.demo_logger.info("Logging demo ending...")
             self.quit()
         
-        # Update window title
+        # Update window title when the FPS reading (refreshed once a second) changes
         fps = self.get_fps()
-        self.window.set_title(f"Logging Demo - FPS: {fps:.1f}")
+        if fps != self._title_fps:
+            self._title_fps = fps
+            self.window.set_title(f"Logging Demo - FPS: {fps:.1f}")
 
 
 if __name__ == "__main__":
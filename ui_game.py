@@ -4,57 +4,172 @@ Complete game example with UI, multiple scenes, and particle effects
 """
 import math
 import random
+from array import array
+from typing import List
 from engine import GameEngine, GameObject, Vector2, Transform, Sprite, Scene
+from engine.core.logger import get_logger
+
+DEBUG_UI = False  # Log button clicks
+_log = get_logger("UI")
+_HIT_DISTANCE_SQ = 25.0 * 25.0  # Player-enemy collision distance, squared
+_HEALTH_BARS = tuple(f"Health: {'█' * i}{'░' * (10 - i)}" for i in range(11))  # Indexed by filled tenths
+_TAU = 2 * math.pi
+_HALF_PI = math.pi / 2
+_WRAP_MARGIN = 20.0  # Screen wrap bounds: the 800x600 screen plus a margin on each side
+_WRAP_WIDTH = 800.0 + 2 * _WRAP_MARGIN
+_WRAP_HEIGHT = 600.0 + 2 * _WRAP_MARGIN
 
 
 class ParticleSystem(GameObject):
     """Simple particle system for visual effects"""
     
+    __slots__ = ('max_particles', 'emit_rate', 'emit_timer', 'gravity', 'pos_x', 'pos_y', 'vel_x', 'vel_y',
+                 'life', 'max_life', 'size', 'colors', 'active_count', '_draw_position')
+    
     def __init__(self, name: str = "ParticleSystem"):
         super().__init__(name)
-        self.particles = []
         self.max_particles = 50
         self.emit_rate = 5.0
         self.emit_timer = 0.0
         self.gravity = Vector2(0, 98)  # Gravity effect
         
+        # Particle state as parallel arrays (one slot per particle) rather than a dict each.
+        # Live particles are packed into the first active_count slots, in emission order.
+        count = self.max_particles
+        self.pos_x = array('d', bytes(8 * count))
+        self.pos_y = array('d', bytes(8 * count))
+        self.vel_x = array('d', bytes(8 * count))
+        self.vel_y = array('d', bytes(8 * count))
+        self.life = array('d', bytes(8 * count))
+        self.max_life = array('d', bytes(8 * count))
+        self.size = array('d', bytes(8 * count))
+        self.colors: List[str] = [''] * count
+        self.active_count = 0
+        self._draw_position = Vector2()  # Reused for every particle drawn
+    
+    @property
+    def particle_count(self) -> int:
+        """Get the number of live particles"""
+        return self.active_count
+        
     def emit_particle(self, position: Vector2, velocity: Vector2, color: str = '#FFD700', life: float = 2.0):
         """Emit a new particle"""
-        if len(self.particles) < self.max_particles:
-            particle = {
-                'position': position.copy(),
-                'velocity': velocity.copy(),
-                'color': color,
-                'life': life,
-                'max_life': life,
-                'size': random.uniform(2, 6)
-            }
-            self.particles.append(particle)
+        i = self.active_count
+        if i < self.max_particles:
+            self.pos_x[i] = position.x
+            self.pos_y[i] = position.y
+            self.vel_x[i] = velocity.x
+            self.vel_y[i] = velocity.y
+            self.life[i] = life
+            self.max_life[i] = life
+            self.size[i] = random.uniform(2, 6)
+            self.colors[i] = color
+            self.active_count = i + 1
+    
+    def emit_burst(self, position: Vector2, count: int, min_speed: float, max_speed: float,
+                   color: str = '#FFD700', life: float = 2.0):
+        """Emit up to count particles from one point in random directions, writing straight into the arrays"""
+        start = self.active_count
+        end = min(start + count, self.max_particles)
+        x = position.x
+        y = position.y
+        uniform = random.uniform
+        cos = math.cos
+        sin = math.sin
+        pos_x = self.pos_x
+        pos_y = self.pos_y
+        vel_x = self.vel_x
+        vel_y = self.vel_y
+        lives = self.life
+        max_life = self.max_life
+        size = self.size
+        colors = self.colors
+        for i in range(start, end):
+            angle = uniform(0, _TAU)
+            speed = uniform(min_speed, max_speed)
+            pos_x[i] = x
+            pos_y[i] = y
+            vel_x[i] = cos(angle) * speed
+            vel_y[i] = sin(angle) * speed
+            lives[i] = life
+            max_life[i] = life
+            size[i] = uniform(2, 6)
+            colors[i] = color
+        self.active_count = end
     
     def update(self, delta_time: float):
         super().update(delta_time)
         
-        # Update existing particles
-        for particle in self.particles[:]:
-            particle['position'] += particle['velocity'] * delta_time
-            particle['velocity'] += self.gravity * delta_time
-            particle['life'] -= delta_time
-            
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+        # Update existing particles, compacting survivors to the front in one pass
+        self.active_count = _integrate_particles(
+            self.pos_x, self.pos_y, self.vel_x, self.vel_y, self.life, self.max_life, self.size, self.colors,
+            self.active_count, self.gravity.x, self.gravity.y, delta_time)
     
     def render(self, renderer):
         """Render all particles"""
-        for particle in self.particles:
-            alpha = particle['life'] / particle['max_life']
-            size = particle['size'] * alpha
-            if size > 0.5:
-                renderer.draw_circle(particle['position'], size, particle['color'])
+        pos_x = self.pos_x
+        pos_y = self.pos_y
+        life = self.life
+        max_life = self.max_life
+        size = self.size
+        colors = self.colors
+        
+        # Collect the visible particles, then draw them in one call where the renderer allows
+        xs = []
+        ys = []
+        radii = []
+        visible_colors = []
+        for i in range(self.active_count):
+            particle_size = size[i] * life[i] / max_life[i]
+            if particle_size > 0.5:
+                xs.append(pos_x[i])
+                ys.append(pos_y[i])
+                radii.append(particle_size)
+                visible_colors.append(colors[i])
+        
+        if hasattr(renderer, 'draw_circles'):
+            renderer.draw_circles(xs, ys, radii, visible_colors)
+        else:
+            position = self._draw_position
+            for x, y, radius, color in zip(xs, ys, radii, visible_colors):
+                position.x = x
+                position.y = y
+                renderer.draw_circle(position, radius, color)
+
+
+def _integrate_particles(pos_x: array, pos_y: array, vel_x: array, vel_y: array, life: array, max_life: array,
+                         size: array, colors: List[str], count: int, gravity_x: float, gravity_y: float,
+                         delta_time: float) -> int:
+    """Advance the first count particles by delta_time, packing survivors to the front; returns their number"""
+    gravity_x *= delta_time
+    gravity_y *= delta_time
+    write = 0
+    for i in range(count):
+        remaining = life[i] - delta_time
+        if remaining <= 0:
+            continue
+        
+        vx = vel_x[i]
+        vy = vel_y[i]
+        pos_x[write] = pos_x[i] + vx * delta_time
+        pos_y[write] = pos_y[i] + vy * delta_time
+        vel_x[write] = vx + gravity_x
+        vel_y[write] = vy + gravity_y
+        life[write] = remaining
+        if write != i:
+            max_life[write] = max_life[i]
+            size[write] = size[i]
+            colors[write] = colors[i]
+        write += 1
+    return write
 
 
 class Player(GameObject):
     """Enhanced player with particle effects"""
     
+    __slots__ = ('speed', 'rotation_speed', 'health', 'max_health', 'score', 'invulnerable_time',
+                 'particle_system', '_sprite')
+    
     def __init__(self, name: str = "Player"):
         super().__init__(name)
         self.speed = 250.0
@@ -67,6 +182,7 @@ class Player(GameObject):
         
         sprite = Sprite(color='#00FF00', size=Vector2(30, 30))
         self.add_component(sprite)
+        self._sprite = sprite
         self.transform.position = Vector2(400, 300)
     
     def take_damage(self, damage: int):
@@ -77,17 +193,13 @@ class Player(GameObject):
             
             # Emit damage particles
             if self.particle_system:
-                for _ in range(10):
-                    vel = Vector2.from_angle(random.uniform(0, 2 * math.pi), random.uniform(50, 150))
-                    self.particle_system.emit_particle(self.transform.position, vel, '#FF0000', 1.0)
+                self.particle_system.emit_burst(self.transform.position, 10, 50, 150, '#FF0000', 1.0)
     
     def add_score(self, points: int):
         """Add score and emit celebration particles"""
         self.score += points
         if self.particle_system:
-            for _ in range(5):
-                vel = Vector2.from_angle(random.uniform(0, 2 * math.pi), random.uniform(30, 80))
-                self.particle_system.emit_particle(self.transform.position, vel, '#FFD700', 0.8)
+            self.particle_system.emit_burst(self.transform.position, 5, 30, 80, '#FFD700', 0.8)
     
     def update(self, delta_time: float):
         super().update(delta_time)
@@ -96,16 +208,12 @@ class Player(GameObject):
             self.invulnerable_time -= delta_time
             
             # Flash when invulnerable
-            sprite = self.get_component(Sprite)
-            if sprite:
-                if int(self.invulnerable_time * 10) % 2:
-                    sprite.color = '#FFFFFF'
-                else:
-                    sprite.color = '#00FF00'
+            if int(self.invulnerable_time * 10) % 2:
+                self._sprite.color = '#FFFFFF'
+            else:
+                self._sprite.color = '#00FF00'
         else:
-            sprite = self.get_component(Sprite)
-            if sprite:
-                sprite.color = '#00FF00'
+            self._sprite.color = '#00FF00'
         
         if hasattr(self.scene, 'engine'):
             input_manager = self.scene.engine.input_manager
@@ -121,28 +229,42 @@ class Player(GameObject):
             if input_manager.is_key_pressed('e'):
                 self.transform.rotate(self.rotation_speed * delta_time)
             
-            # Wrap around screen
+            # Wrap around screen (including a margin so the player fully leaves before wrapping)
             pos = self.transform.position
-            if pos.x < -20: pos.x = 820
-            elif pos.x > 820: pos.x = -20
-            if pos.y < -20: pos.y = 620
-            elif pos.y > 620: pos.y = -20
+            pos.x = (pos.x + _WRAP_MARGIN) % _WRAP_WIDTH - _WRAP_MARGIN
+            pos.y = (pos.y + _WRAP_MARGIN) % _WRAP_HEIGHT - _WRAP_MARGIN
 
 
 class Enemy(GameObject):
     """Enhanced enemy with AI and particle effects"""
     
+    __slots__ = ('center', 'radius', 'angle', 'speed', 'health', 'damage_timer', '_sprite')
+    
     def __init__(self, name: str = "Enemy", center: Vector2 = None, radius: float = 100):
         super().__init__(name)
         self.center = center or Vector2(400, 300)
         self.radius = radius
-        self.angle = random.uniform(0, 2 * math.pi)
+        self.angle = random.uniform(0, _TAU)
         self.speed = random.uniform(1.5, 3.0)
         self.health = 50
         self.damage_timer = 0.0
         
         sprite = Sprite(color='#FF3232', size=Vector2(25, 25), shape='circle')
         self.add_component(sprite)
+        self._sprite = sprite
+    
+    def reinitialize(self, name: str = "Enemy", center: Vector2 = None, radius: float = 100):
+        """Reuse a recycled enemy, keeping its sprite"""
+        self.name = name
+        self.center = center or Vector2(400, 300)
+        self.radius = radius
+        self.angle = random.uniform(0, _TAU)
+        self.speed = random.uniform(1.5, 3.0)
+        self.health = 50
+        self.damage_timer = 0.0
+        
+        self._sprite.color = '#FF3232'
+        self.add_component(self._sprite)
         
     def take_damage(self, damage: int):
         """Take damage"""
@@ -154,21 +276,22 @@ class Enemy(GameObject):
         
         if self.damage_timer > 0:
             self.damage_timer -= delta_time
-            sprite = self.get_component(Sprite)
-            if sprite:
-                sprite.color = '#FFFFFF' if int(self.damage_timer * 20) % 2 else '#FF3232'
+            self._sprite.color = '#FFFFFF' if int(self.damage_timer * 20) % 2 else '#FF3232'
         else:
-            sprite = self.get_component(Sprite)
-            if sprite:
-                sprite.color = '#FF3232'
-        
-        # Move in orbit
-        self.angle += self.speed * delta_time
-        offset = Vector2.from_angle(self.angle, self.radius)
-        self.transform.position = self.center + offset
+            self._sprite.color = '#FF3232'
+        
+        # Move in orbit, writing the position in place rather than building Vector2s
+        angle = self.angle + self.speed * delta_time
+        self.angle = angle
+        radius = self.radius
+        center = self.center
+        transform = self.transform
+        position = transform.position
+        position.x = center.x + math.cos(angle) * radius
+        position.y = center.y + math.sin(angle) * radius
         
         # Face movement direction
-        self.transform.rotation = self.angle + math.pi / 2
+        transform.rotation = angle + _HALF_PI
         
         # Check if dead
         if self.health <= 0:
@@ -184,6 +307,8 @@ class Enemy(GameObject):
 class UIElement(GameObject):
     """Base UI element"""
     
+    __slots__ = ('text', 'font_size', 'color', 'background_color')
+    
     def __init__(self, name: str = "UIElement"):
         super().__init__(name)
         self.text = ""
@@ -194,8 +319,11 @@ class UIElement(GameObject):
     def render(self, renderer):
         if self.background_color:
             # Draw background
-            text_size = Vector2(len(self.text) * self.font_size * 0.6, self.font_size * 1.2)
-            bg_pos = self.transform.position - text_size / 2
+            width = len(self.text) * self.font_size * 0.6
+            height = self.font_size * 1.2
+            text_size = Vector2(width, height)
+            position = self.transform.position
+            bg_pos = Vector2(position.x - width * 0.5, position.y - height * 0.5)
             renderer.draw_rect(bg_pos, text_size, self.background_color)
         
         # Draw text
@@ -205,6 +333,8 @@ class UIElement(GameObject):
 class Button(UIElement):
     """Interactive button"""
     
+    __slots__ = ('callback', '_size', '_half_x', '_half_y', 'is_hovered', 'is_pressed')
+    
     def __init__(self, name: str = "Button", text: str = "Button", callback=None):
         super().__init__(name)
         self.text = text
@@ -212,6 +342,18 @@ class Button(UIElement):
         self.size = Vector2(120, 40)
         self.is_hovered = False
         self.is_pressed = False
+    
+    @property
+    def size(self) -> Vector2:
+        """Get the button size"""
+        return self._size
+    
+    @size.setter
+    def size(self, size: Vector2):
+        """Set the button size, caching the half extents used for hit-testing"""
+        self._size = size
+        self._half_x = size.x * 0.5
+        self._half_y = size.y * 0.5
         
     def update(self, delta_time: float):
         super().update(delta_time)
@@ -220,28 +362,22 @@ class Button(UIElement):
             input_manager = self.scene.engine.input_manager
             mouse_pos = input_manager.get_mouse_position()
             
-            # Check if mouse is over button
-            button_rect = (
-                self.transform.position.x - self.size.x / 2,
-                self.transform.position.y - self.size.y / 2,
-                self.size.x,
-                self.size.y
-            )
-            
-            self.is_hovered = (
-                button_rect[0] <= mouse_pos.x <= button_rect[0] + button_rect[2] and
-                button_rect[1] <= mouse_pos.y <= button_rect[1] + button_rect[3]
-            )
+            # Check if mouse is over button (distance from the center against the half extents)
+            position = self.transform.position
+            self.is_hovered = ((abs(mouse_pos.x - position.x) <= self._half_x) &
+                               (abs(mouse_pos.y - position.y) <= self._half_y))
             
             # Check for click
             if self.is_hovered and input_manager.is_mouse_button_just_pressed('left'):
                 self.is_pressed = True
-                print(f"Button '{self.text}' clicked!")
+                if DEBUG_UI:
+                    _log.debug(f"Button '{self.text}' clicked!")
                 if self.callback:
-                    print(f"Executing callback for button '{self.text}'")
+                    if DEBUG_UI:
+                        _log.debug(f"Executing callback for button '{self.text}'")
                     self.callback()
-                else:
-                    print(f"No callback set for button '{self.text}'")
+                elif DEBUG_UI:
+                    _log.debug(f"No callback set for button '{self.text}'")
             elif not input_manager.is_mouse_button_pressed('left'):
                 self.is_pressed = False
     
@@ -256,8 +392,9 @@ class Button(UIElement):
             bg_color = '#888888'
         
         # Draw button background
-        button_pos = self.transform.position - self.size / 2
-        renderer.draw_rectangle(button_pos, self.size, bg_color, 0.0, '#FFFFFF')
+        position = self.transform.position
+        button_pos = Vector2(position.x - self._half_x, position.y - self._half_y)
+        renderer.draw_rectangle(button_pos, self._size, bg_color, 0.0, '#FFFFFF')
         
         # Draw button text centered
         renderer.draw_text(self.transform.position, self.text, text_color, 14)
@@ -319,6 +456,17 @@ class GameScene(Scene):
         self.wave_timer = 0.0
         self.game_time = 0.0
         
+        # Objects read every frame, kept here instead of looked up by name
+        self._player = None
+        self._health_bg = None
+        self._score_display = None
+        self._wave_display = None
+        
+        # Values the HUD currently shows, so labels are only rebuilt when they change
+        self._shown_health = None
+        self._shown_score = None
+        self._shown_wave = None
+        
     def initialize(self):
         super().initialize()
         
@@ -330,6 +478,7 @@ class GameScene(Scene):
         player = Player("Player")
         player.particle_system = particle_system
         self.add_object(player)
+        self._player = player
         
         # Start first wave
         self.start_wave()
@@ -343,26 +492,38 @@ class GameScene(Scene):
         health_bg = UIElement("HealthBG")
         health_bg.transform.position = Vector2(100, 30)
         self.add_object(health_bg)
+        self._health_bg = health_bg
         
         # Score display
         score_display = UIElement("ScoreDisplay")
         score_display.transform.position = Vector2(400, 30)
         self.add_object(score_display)
+        self._score_display = score_display
         
         # Wave display
         wave_display = UIElement("WaveDisplay")
         wave_display.transform.position = Vector2(700, 30)
         self.add_object(wave_display)
+        self._wave_display = wave_display
     
     def start_wave(self):
         """Start a new wave of enemies"""
-        self.enemies_remaining = 3 + self.wave
-        
-        for i in range(self.enemies_remaining):
-            angle = (i / self.enemies_remaining) * 2 * math.pi
-            center = Vector2(400, 300) + Vector2.from_angle(angle, 150 + self.wave * 20)
-            enemy = Enemy(f"Enemy_{self.wave}_{i}", center, 40 + random.uniform(-20, 20))
-            self.add_object(enemy)
+        count = 3 + self.wave
+        self.enemies_remaining = count
+        
+        # Centers are evenly spaced on a ring: turn one unit vector by a fixed step instead
+        # of calling sin/cos for every enemy
+        ring_radius = 150 + self.wave * 20
+        step = _TAU / count
+        step_cos = math.cos(step)
+        step_sin = math.sin(step)
+        dir_x = 1.0
+        dir_y = 0.0
+        for i in range(count):
+            center = Vector2(400 + dir_x * ring_radius, 300 + dir_y * ring_radius)
+            # Spawned, so enemies destroyed in earlier waves are reused
+            self.spawn(Enemy, f"Enemy_{self.wave}_{i}", center, 40 + random.uniform(-20, 20))
+            dir_x, dir_y = dir_x * step_cos - dir_y * step_sin, dir_x * step_sin + dir_y * step_cos
     
     def update(self, delta_time: float):
         super().update(delta_time)
@@ -371,7 +532,7 @@ class GameScene(Scene):
         self.wave_timer += delta_time
         
         # Check for player death
-        player = self.find_object("Player")
+        player = self._player
         if player and player.health <= 0:
             if hasattr(self, 'engine'):
                 game_over_scene = GameOverScene(player.score, self.game_time)
@@ -379,19 +540,22 @@ class GameScene(Scene):
             return
         
         # Check for wave completion
-        enemies = self.find_objects_with_tag("enemy")
+        enemies = self.find_objects_with_tag_view("enemy")
         if not enemies and self.wave_timer > 2.0:
             self.wave += 1
             self.wave_timer = 0.0
             self.start_wave()
         
-        # Collision detection
+        # Collision detection (squared distances, so no sqrt per enemy)
         if player:
             player_pos = player.transform.position
+            px = player_pos.x
+            py = player_pos.y
             for enemy in enemies:
                 enemy_pos = enemy.transform.position
-                distance = player_pos.distance_to(enemy_pos)
-                if distance < 25:
+                dx = enemy_pos.x - px
+                dy = enemy_pos.y - py
+                if dx * dx + dy * dy < _HIT_DISTANCE_SQ:
                     player.take_damage(20)
         
         # Update UI
@@ -399,28 +563,37 @@ class GameScene(Scene):
     
     def update_ui(self):
         """Update UI elements"""
-        player = self.find_object("Player")
+        player = self._player
         if not player:
             return
         
         # Health bar
-        health_bg = self.find_object("HealthBG")
-        if health_bg:
-            health_percent = player.health / player.max_health
-            health_bg.text = f"Health: {'█' * int(health_percent * 10)}{'░' * (10 - int(health_percent * 10))}"
-            health_bg.color = '#00FF00' if health_percent > 0.5 else '#FFFF00' if health_percent > 0.25 else '#FF0000'
+        health = player.health
+        if health != self._shown_health:
+            self._shown_health = health
+            health_bg = self._health_bg
+            if health_bg:
+                health_percent = health / player.max_health
+                health_bg.text = _HEALTH_BARS[max(0, min(10, int(health_percent * 10)))]
+                health_bg.color = '#00FF00' if health_percent > 0.5 else '#FFFF00' if health_percent > 0.25 else '#FF0000'
         
         # Score
-        score_display = self.find_object("ScoreDisplay")
-        if score_display:
-            score_display.text = f"Score: {player.score}"
-            score_display.color = '#FFFFFF'
+        score = player.score
+        if score != self._shown_score:
+            self._shown_score = score
+            score_display = self._score_display
+            if score_display:
+                score_display.text = f"Score: {score}"
+                score_display.color = '#FFFFFF'
         
         # Wave
-        wave_display = self.find_object("WaveDisplay")
-        if wave_display:
-            wave_display.text = f"Wave: {self.wave}"
-            wave_display.color = '#FFFFFF'
+        wave = self.wave
+        if wave != self._shown_wave:
+            self._shown_wave = wave
+            wave_display = self._wave_display
+            if wave_display:
+                wave_display.text = f"Wave: {wave}"
+                wave_display.color = '#FFFFFF'
 
 
 class GameOverScene(Scene):
@@ -488,6 +661,10 @@ class CompleteGame(GameEngine):
         menu_scene.engine = self  # Give scene access to engine
         self.load_scene(menu_scene)
         
+        # Values shown in the window title, so it is only rebuilt when they change
+        self._title_fps = None
+        self._title_scene = None
+        
         print("Space Defense - Complete Game")
         print("Starting at main menu...")
     
@@ -506,10 +683,13 @@ class CompleteGame(GameEngine):
         if self.input_manager.is_key_just_pressed('f11'):
             self.toggle_fullscreen()
         
-        # Update window title with scene info
+        # Update window title with scene info (the FPS reading changes once a second)
         fps = self.get_fps()
         scene_name = self.current_scene.name if self.current_scene else "None"
-        self.window.set_title(f"Space Defense - {scene_name} - FPS: {fps:.1f}")
+        if fps != self._title_fps or scene_name != self._title_scene:
+            self._title_fps = fps
+            self._title_scene = scene_name
+            self.window.set_title(f"Space Defense - {scene_name} - FPS: {fps:.1f}")
     
     def load_scene(self, scene):
         """Load a new scene"""